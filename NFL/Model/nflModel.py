@@ -1,31 +1,82 @@
 import aiohttp
 import asyncio
 import json
+import string
 import time
-import requests
-from typing import List, Dict, Any, Tuple
+import orjson
+from typing import List, Dict, Any, Tuple, Optional, Callable, Awaitable
 from datetime import datetime
 
+# Metadata keys that carry no analytical value but still cost prompt tokens
+DROP_KEYS = frozenset({"$ref", "links", "href", "uid", "guid", "headshot", "logo", "logos", "bio"})
+# Team-scoped endpoints repeat the team on every row; the prompt already names it
+TEAM_DROP_KEYS = DROP_KEYS | {"Team"}
+
+def to_json(data: Any) -> str:
+    """Serialize API data compactly for embedding in a prompt"""
+    return orjson.dumps(data).decode()
+
+def parse_json(raw: bytes) -> Any:
+    """Parse a response body, falling back to stdlib json for NaN/Infinity tokens"""
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+def project(data: Any, drop: frozenset) -> Any:
+    """Recursively strip unwanted keys and null/NaN values from API data"""
+    if isinstance(data, dict):
+        return {
+            key: project(value, drop)
+            for key, value in data.items()
+            if key not in drop
+            and value is not None
+            and not (isinstance(value, float) and value != value)
+        }
+    if isinstance(data, list):
+        return [project(item, drop) for item in data]
+    return data
+
 class NFLAnalyzer:
     def __init__(self):
         print("\nInitializing NFL Analyzer with Ollama...")
-        self.ollama_url = "http://localhost:11434/api/generate"
+        self.ollama_url = "http://localhost:11434/api/chat"
         self.api_base = "https://sportsstatsgather.com/api"
         self.espn_api = "https://site.api.espn.com/apis/site/v2/sports/football/nfl"
-        self.model = "llama3.2"
+        self.model = "llama3.2:3b-instruct-q4_K_M"
         self.model_params = {
-            "context_length": 65536,
             "num_ctx": 65536,
-            "num_gpu": 1,
-            "num_thread": 4,
-            "gpu_layers": 35
+            "num_batch": 512,   # Prompt-eval batch size; prompts are mostly JSON context
+            "num_keep": 256,    # Keep the shared system prefix across context shifts
+            "num_gpu": -1,      # Offload as many layers as VRAM allows
+            "num_thread": 4
         }
+        # Identical on every request so Ollama can reuse the cached prefix
+        self.system_prompt = (
+            "You are an expert NFL analyst. Analyze only the data provided in "
+            "each request and give specific, data-driven insights with clear "
+            "betting implications."
+        )
         self.analyses = {}
+        self.session = None
+        # Long generations share the pooled keep-alive session with the API calls
+        self.llm_timeout = aiohttp.ClientTimeout(total=600)
+        self._cache: Dict[tuple, asyncio.Task] = {}
+        self._json_cache: Dict[tuple, str] = {}
+        
+        # Bound concurrent API requests and retry throttled/server errors
+        self._api_sem = asyncio.Semaphore(10)
+        self.max_retries = 3
+        self.retry_delay = 0.5  # seconds, doubled per attempt
         
         # Load prompts from JSON file
         try:
             with open('nfl_prompts.json', 'r') as f:
                 self.prompts = json.load(f)
+            self._compiled = {
+                name: self._compile_prompt(template)
+                for name, template in self.prompts.items()
+            }
             print("✓ Prompts loaded successfully")
         except FileNotFoundError:
             print("❌ Error: nfl_prompts.json not found in current directory")
@@ -34,35 +85,121 @@ class NFLAnalyzer:
             print("❌ Error: Invalid JSON in nfl_prompts.json")
             raise
 
+    @staticmethod
+    def _compile_prompt(template: str) -> Tuple[Tuple[str, ...], Tuple[Optional[str], ...]]:
+        """Split a format template into its literal text and field names once"""
+        parsed = list(string.Formatter().parse(template))
+        literals = tuple(literal for literal, _, _, _ in parsed)
+        fields = tuple(field for _, field, _, _ in parsed)
+        return literals, fields
+
+    def _render(self, name: str, **kwargs) -> str:
+        """Fill a precompiled prompt without re-parsing its template"""
+        literals, fields = self._compiled[name]
+        parts = []
+        for literal, field in zip(literals, fields):
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(kwargs[field]))
+        return "".join(parts)
+
+    async def __aenter__(self):
+        """Open a pooled HTTP session shared by every API call"""
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                keepalive_timeout=30,
+                ttl_dns_cache=300
+            )
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the shared HTTP session"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
     async def get_data(self, endpoint: str, params: dict = None) -> Dict:
+        """Fetch data from the NFL API, sharing one request per unique endpoint/params"""
+        key = self._cache_key(endpoint, params)
+        task = self._cache.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_data(endpoint, params))
+            self._cache[key] = task
+        
+        try:
+            # Shielded so a cancelled caller can't cancel a fetch other callers share
+            return await asyncio.shield(task)
+        except Exception:
+            # Don't cache failures so a later call can retry
+            self._cache.pop(key, None)
+            raise
+
+    async def get_data_json(self, endpoint: str, params: dict = None) -> str:
+        """Fetch data as compact JSON, serializing each unique response only once"""
+        data = await self.get_data(endpoint, params)
+        key = self._cache_key(endpoint, params)
+        text = self._json_cache.get(key)
+        if text is None:
+            text = self._json_cache[key] = to_json(data)
+        return text
+
+    @staticmethod
+    def _cache_key(endpoint: str, params: Optional[dict]) -> tuple:
+        """Hashable key identifying an API request"""
+        return (endpoint, frozenset((params or {}).items()))
+
+    async def _run_tasks(self, *coros: Awaitable) -> List[Any]:
+        """Run coroutines concurrently, cancelling the rest as soon as one fails"""
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(coro) for coro in coros]
+        except ExceptionGroup as group:
+            # Surface the underlying failure instead of the group wrapper
+            raise group.exceptions[0]
+        return [task.result() for task in tasks]
+
+    def clear_cache(self) -> None:
+        """Drop cached API responses (called when switching weeks)"""
+        self._cache.clear()
+        self._json_cache.clear()
+
+    async def _fetch_data(self, endpoint: str, params: dict = None) -> Dict:
         """Fetch data from the NFL API"""
         url = f"{self.api_base}/nfl/data/{endpoint}"
         print(f"Fetching data from: {url}")
         print(f"Parameters: {params}")
         start_time = time.time()
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                data = await response.json()
-                elapsed = time.time() - start_time
-                print(f"✓ Data received in {elapsed:.2f} seconds")
-                return data
-
-    async def get_weeks(self) -> List[Dict]:
-        """Get available NFL weeks from ESPN API"""
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.espn_api}/scoreboard"
-            async with session.get(url) as response:
-                data = await response.json()
-                return list(range(1, 19))  # Regular season weeks 1-18
+        for attempt in range(self.max_retries):
+            async with self._api_sem:
+                async with self.session.get(url, params=params) as response:
+                    retryable = response.status == 429 or response.status >= 500
+                    if not retryable or attempt == self.max_retries - 1:
+                        drop = TEAM_DROP_KEYS if params and "team" in params else DROP_KEYS
+                        data = project(parse_json(await response.read()), drop)
+                        elapsed = time.time() - start_time
+                        print(f"✓ Data received in {elapsed:.2f} seconds")
+                        return data
+            
+            # Back off outside the semaphore so other requests can proceed
+            delay = self.retry_delay * 2 ** attempt
+            print(f"⚠️  {endpoint} returned {response.status}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    async def get_weeks(self) -> List[int]:
+        """Get available NFL weeks (regular season weeks 1-18)"""
+        return list(range(1, 19))
 
     async def get_games(self, week: int) -> List[Dict]:
         """Get games for specified week from ESPN API"""
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.espn_api}/scoreboard?week={week}&seasontype=2"
-            async with session.get(url) as response:
-                data = await response.json()
-                return data.get('events', [])
+        self.clear_cache()
+        url = f"{self.espn_api}/scoreboard?week={week}&seasontype=2"
+        async with self.session.get(url) as response:
+            data = orjson.loads(await response.read())
+            return data.get('events', [])
 
     async def get_game_odds(self, game_data: Dict) -> Dict:
         """Extract odds from game data"""
@@ -87,16 +224,16 @@ class NFLAnalyzer:
         """Prompt 1: Analyze team depth charts"""
         print("\nAnalyzing depth charts...")
         tasks = [
-            self.get_data("depthchart", {"team": home_team}),
-            self.get_data("depthchart", {"team": away_team})
+            self.get_data_json("depthchart", {"team": home_team}),
+            self.get_data_json("depthchart", {"team": away_team})
         ]
         
-        home_depth, away_depth = await asyncio.gather(*tasks)
-        prompt = self.prompts["prompt_1"].format(
+        home_depth, away_depth = await self._run_tasks(*tasks)
+        prompt = self._render("prompt_1",
             home_team=home_team,
             away_team=away_team,
-            home_depth=json.dumps(home_depth, indent=2),
-            away_depth=json.dumps(away_depth, indent=2)
+            home_depth=home_depth,
+            away_depth=away_depth
         )
         
         return await self.get_llama_response(prompt)
@@ -106,17 +243,25 @@ class NFLAnalyzer:
         print("\nAnalyzing weather and injuries...")
         tasks = [
             self.get_data("weather", {}),
-            self.get_data("injuryreports", {"team": home_team}),
-            self.get_data("injuryreports", {"team": away_team})
+            self.get_data_json("injuryreports", {"team": home_team}),
+            self.get_data_json("injuryreports", {"team": away_team})
         ]
         
-        weather, home_injuries, away_injuries = await asyncio.gather(*tasks)
-        prompt = self.prompts["prompt_2"].format(
+        weather, home_injuries, away_injuries = await self._run_tasks(*tasks)
+        
+        # The weather feed covers the whole slate; keep only this game's row
+        if isinstance(weather, list):
+            weather = [
+                w for w in weather
+                if isinstance(w, dict) and w.get('Home Team') == home_team
+            ] or weather
+        
+        prompt = self._render("prompt_2",
             home_team=home_team,
             away_team=away_team,
-            weather=json.dumps(weather, indent=2),
-            home_injuries=json.dumps(home_injuries, indent=2),
-            away_injuries=json.dumps(away_injuries, indent=2)
+            weather=to_json(weather),
+            home_injuries=home_injuries,
+            away_injuries=away_injuries
         )
         
         return await self.get_llama_response(prompt)
@@ -125,23 +270,23 @@ class NFLAnalyzer:
         """Prompts 3-6: Analyze team performance"""
         print(f"\nAnalyzing {period} performance for {team}...")
         tasks = [
-            self.get_data("playerstats", {
+            self.get_data_json("playerstats", {
                 "team": team,
                 "view": view,
                 "split": period
             }) for view in ["Passing", "Rushing", "Receiving"]
         ]
         
-        passing, rushing, receiving = await asyncio.gather(*tasks)
+        passing, rushing, receiving = await self._run_tasks(*tasks)
         prompt_num = "3" if is_home and period == "Last 4 Weeks" else \
                     "4" if is_home and period == "Last 2 Weeks" else \
                     "5" if not is_home and period == "Last 4 Weeks" else "6"
         
-        prompt = self.prompts[f"prompt_{prompt_num}"].format(
+        prompt = self._render(f"prompt_{prompt_num}",
             team=team,
-            passing=json.dumps(passing, indent=2),
-            rushing=json.dumps(rushing, indent=2),
-            receiving=json.dumps(receiving, indent=2)
+            passing=passing,
+            rushing=rushing,
+            receiving=receiving
         )
         
         return await self.get_llama_response(prompt)
@@ -150,20 +295,20 @@ class NFLAnalyzer:
         """Prompts 7-8: Analyze defensive performance"""
         print(f"\nAnalyzing defensive performance for {team}...")
         tasks = [
-            self.get_data("playerstats", {
+            self.get_data_json("playerstats", {
                 "team": team,
                 "view": "Defensive",
                 "split": period
             }) for period in ["Last 2 Weeks", "Last 4 Weeks"]
         ]
         
-        defense_2wk, defense_4wk = await asyncio.gather(*tasks)
+        defense_2wk, defense_4wk = await self._run_tasks(*tasks)
         prompt_num = "7" if is_home else "8"
         
-        prompt = self.prompts[f"prompt_{prompt_num}"].format(
+        prompt = self._render(f"prompt_{prompt_num}",
             team=team,
-            defense_2wk=json.dumps(defense_2wk, indent=2),
-            defense_4wk=json.dumps(defense_4wk, indent=2)
+            defense_2wk=defense_2wk,
+            defense_4wk=defense_4wk
         )
         
         return await self.get_llama_response(prompt)
@@ -172,16 +317,16 @@ class NFLAnalyzer:
         """Prompt 9: Analyze team defense statistics"""
         print("\nAnalyzing team defense statistics...")
         tasks = [
-            self.get_data("teamdefense", {"team": home_team}),
-            self.get_data("teamdefense", {"team": away_team})
+            self.get_data_json("teamdefense", {"team": home_team}),
+            self.get_data_json("teamdefense", {"team": away_team})
         ]
         
-        home_defense, away_defense = await asyncio.gather(*tasks)
-        prompt = self.prompts["prompt_9"].format(
+        home_defense, away_defense = await self._run_tasks(*tasks)
+        prompt = self._render("prompt_9",
             home_team=home_team,
             away_team=away_team,
-            home_defense=json.dumps(home_defense, indent=2),
-            away_defense=json.dumps(away_defense, indent=2)
+            home_defense=home_defense,
+            away_defense=away_defense
         )
         
         return await self.get_llama_response(prompt)
@@ -190,16 +335,16 @@ class NFLAnalyzer:
         """Prompt 10: Analyze pass rushing and missed tackles"""
         print("\nAnalyzing pass rushing and missed tackles...")
         tasks = [
-            self.get_data("teamdefense", {"team": home_team}),
-            self.get_data("teamdefense", {"team": away_team})
+            self.get_data_json("teamdefense", {"team": home_team}),
+            self.get_data_json("teamdefense", {"team": away_team})
         ]
         
-        home_pressure, away_pressure = await asyncio.gather(*tasks)
-        prompt = self.prompts["prompt_10"].format(
+        home_pressure, away_pressure = await self._run_tasks(*tasks)
+        prompt = self._render("prompt_10",
             home_team=home_team,
             away_team=away_team,
-            home_pressure=json.dumps(home_pressure, indent=2),
-            away_pressure=json.dumps(away_pressure, indent=2)
+            home_pressure=home_pressure,
+            away_pressure=away_pressure
         )
         
         return await self.get_llama_response(prompt)
@@ -208,16 +353,16 @@ class NFLAnalyzer:
         """Prompt 11: Analyze penalties, third down, red zone"""
         print("\nAnalyzing team statistics...")
         tasks = [
-            self.get_data("teamstats/team", {"team": home_team}),
-            self.get_data("teamstats/team", {"team": away_team})
+            self.get_data_json("teamstats/team", {"team": home_team}),
+            self.get_data_json("teamstats/team", {"team": away_team})
         ]
         
-        home_stats, away_stats = await asyncio.gather(*tasks)
-        prompt = self.prompts["prompt_11"].format(
+        home_stats, away_stats = await self._run_tasks(*tasks)
+        prompt = self._render("prompt_11",
             home_team=home_team,
             away_team=away_team,
-            home_stats=json.dumps(home_stats, indent=2),
-            away_stats=json.dumps(away_stats, indent=2)
+            home_stats=home_stats,
+            away_stats=away_stats
         )
         
         return await self.get_llama_response(prompt)
@@ -226,16 +371,16 @@ class NFLAnalyzer:
         """Prompt 12: Analyze pass protection and scramble"""
         print("\nAnalyzing pass protection and scramble statistics...")
         tasks = [
-            self.get_data("teampasspressure", {"team": home_team}),
-            self.get_data("teampasspressure", {"team": away_team})
+            self.get_data_json("teampasspressure", {"team": home_team}),
+            self.get_data_json("teampasspressure", {"team": away_team})
         ]
         
-        home_protection, away_protection = await asyncio.gather(*tasks)
-        prompt = self.prompts["prompt_12"].format(
+        home_protection, away_protection = await self._run_tasks(*tasks)
+        prompt = self._render("prompt_12",
             home_team=home_team,
             away_team=away_team,
-            home_protection=json.dumps(home_protection, indent=2),
-            away_protection=json.dumps(away_protection, indent=2)
+            home_protection=home_protection,
+            away_protection=away_protection
         )
         
         return await self.get_llama_response(prompt)
@@ -244,42 +389,63 @@ class NFLAnalyzer:
         """Prompt 13: Analyze game logs"""
         print("\nAnalyzing game logs...")
         tasks = [
-            self.get_data("gamelogs", {"team": home_team}),
-            self.get_data("gamelogs", {"team": away_team}),
-            self.get_data("oppgamelogs", {"team": home_team}),
-            self.get_data("oppgamelogs", {"team": away_team})
+            self.get_data_json("gamelogs", {"team": home_team}),
+            self.get_data_json("gamelogs", {"team": away_team}),
+            self.get_data_json("oppgamelogs", {"team": home_team}),
+            self.get_data_json("oppgamelogs", {"team": away_team})
         ]
         
-        home_logs, away_logs, home_opp, away_opp = await asyncio.gather(*tasks)
-        prompt = self.prompts["prompt_13"].format(
+        home_logs, away_logs, home_opp, away_opp = await self._run_tasks(*tasks)
+        prompt = self._render("prompt_13",
             home_team=home_team,
             away_team=away_team,
-            home_logs=json.dumps(home_logs, indent=2),
-            away_logs=json.dumps(away_logs, indent=2),
-            home_opp=json.dumps(home_opp, indent=2),
-            away_opp=json.dumps(away_opp, indent=2)
+            home_logs=home_logs,
+            away_logs=away_logs,
+            home_opp=home_opp,
+            away_opp=away_opp
         )
         
         return await self.get_llama_response(prompt)
 
-    async def get_llama_response(self, prompt: str) -> str:
-        """Get response from Ollama"""
-        response = requests.post(self.ollama_url, json={
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False,
-            **self.model_params
-        })
-        return response.json()['response']
-
-    async def get_final_recommendation(self, analyses: Dict[str, str], game_data: Dict) -> str:
+    async def get_llama_response(self, prompt: str,
+                                 on_token: Optional[Callable[[str], None]] = None) -> str:
+        """Stream a response from Ollama, optionally reporting tokens as they arrive"""
+        chunks = []
+        async with self.session.post(
+            self.ollama_url,
+            json={
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": self.system_prompt},
+                    {"role": "user", "content": prompt}
+                ],
+                "stream": True,
+                "keep_alive": "30m",
+                "options": self.model_params
+            },
+            timeout=self.llm_timeout
+        ) as response:
+            response.raise_for_status()
+            async for line in response.content:
+                if not line.strip():
+                    continue
+                chunk = orjson.loads(line)
+                # Failures after the 200 (e.g. a runner crash) arrive as an error line
+                if 'error' in chunk:
+                    raise Exception(f"Ollama error: {chunk['error']}")
+                token = chunk.get('message', {}).get('content', '')
+                chunks.append(token)
+                if on_token:
+                    on_token(token)
+                if chunk.get('done'):
+                    break
+        return "".join(chunks)
+
+    async def get_final_recommendation(self, analyses: Dict[str, str], game_data: Dict,
+                                       home_team: str, away_team: str,
+                                       venue: str, date: str) -> str:
         """Prompt 14: Generate final betting recommendations"""
         try:
-            home_team = game_data['competitions'][0]['competitors'][0]['team']['displayName']
-            away_team = game_data['competitions'][0]['competitors'][1]['team']['displayName']
-            venue = game_data['competitions'][0]['venue']['fullName']
-            date = game_data['date']
-            
             # Get odds data
             odds = await self.get_game_odds(game_data)
             
@@ -292,9 +458,9 @@ Venue: {venue}
 Date: {date}"""
             
             # Format the prompt with game info and analyses
-            prompt = self.prompts["prompt_14"].format(
+            prompt = self._render("prompt_14",
                 game_info=game_info,
-                analyses=json.dumps(analyses, indent=2)
+                analyses=to_json(analyses)
             )
             
             return await self.get_llama_response(prompt)
@@ -304,36 +470,34 @@ Date: {date}"""
 
     async def analyze_game(self, game_data: Dict) -> Dict[str, str]:
         """Run complete game analysis"""
-        home_team = game_data['competitions'][0]['competitors'][0]['team']['displayName']
-        away_team = game_data['competitions'][0]['competitors'][1]['team']['displayName']
-        
-        analyses = {}
+        competition = game_data['competitions'][0]
+        home_team = competition['competitors'][0]['team']['displayName']
+        away_team = competition['competitors'][1]['team']['displayName']
+        venue = competition['venue']['fullName']
+        date = game_data['date']
         
-        # Run all analyses
-        analyses['depth_charts'] = await self.analyze_depth_charts(home_team, away_team)
-        analyses['weather_injuries'] = await self.analyze_weather_injuries(home_team, away_team)
-        
-        # Team performance analyses
-        for period in ["Last 4 Weeks", "Last 2 Weeks"]:
-            analyses[f'home_{period.lower().replace(" ", "_")}'] = \
-                await self.analyze_team_performance(home_team, period, True)
-            analyses[f'away_{period.lower().replace(" ", "_")}'] = \
-                await self.analyze_team_performance(away_team, period, False)
-        
-        # Defense analyses
-        analyses['home_defense'] = await self.analyze_defense(home_team, True)
-        analyses['away_defense'] = await self.analyze_defense(away_team, False)
-        
-        # Additional analyses
-        analyses['team_defense'] = await self.analyze_team_defense(home_team, away_team)
-        analyses['pass_pressure'] = await self.analyze_pass_pressure(home_team, away_team)
-        analyses['team_stats'] = await self.analyze_team_stats(home_team, away_team)
-        analyses['pass_protection'] = await self.analyze_pass_protection(home_team, away_team)
-        analyses['game_logs'] = await self.analyze_game_logs(home_team, away_team)
+        # Prompts 1-13 are independent, so run them concurrently
+        coros = {
+            'depth_charts': self.analyze_depth_charts(home_team, away_team),
+            'weather_injuries': self.analyze_weather_injuries(home_team, away_team),
+            'home_last_4_weeks': self.analyze_team_performance(home_team, "Last 4 Weeks", True),
+            'away_last_4_weeks': self.analyze_team_performance(away_team, "Last 4 Weeks", False),
+            'home_last_2_weeks': self.analyze_team_performance(home_team, "Last 2 Weeks", True),
+            'away_last_2_weeks': self.analyze_team_performance(away_team, "Last 2 Weeks", False),
+            'home_defense': self.analyze_defense(home_team, True),
+            'away_defense': self.analyze_defense(away_team, False),
+            'team_defense': self.analyze_team_defense(home_team, away_team),
+            'pass_pressure': self.analyze_pass_pressure(home_team, away_team),
+            'team_stats': self.analyze_team_stats(home_team, away_team),
+            'pass_protection': self.analyze_pass_protection(home_team, away_team),
+            'game_logs': self.analyze_game_logs(home_team, away_team)
+        }
+        results = await self._run_tasks(*coros.values())
+        analyses = dict(zip(coros.keys(), results))
         
         # Final recommendations
         analyses['final_recommendation'] = await self.get_final_recommendation(
-            analyses, game_data
+            analyses, game_data, home_team, away_team, venue, date
         )
         
         return analyses
@@ -343,53 +507,53 @@ async def main():
     print("=======================")
     
     analyzer = NFLAnalyzer()
+    async with analyzer:
+        # Get available weeks
+        weeks = await analyzer.get_weeks()
+        print("\nAvailable Weeks:")
+        for week in weeks:
+            print(f"{week}. Week {week}")
     
-    # Get available weeks
-    weeks = await analyzer.get_weeks()
-    print("\nAvailable Weeks:")
-    for week in weeks:
-        print(f"{week}. Week {week}")
-    
-    # Get week selection
-    while True:
-        try:
-            week = int(input("\nEnter week number (1-18): "))
-            if 1 <= week <= 18:
+        # Get week selection
+        while True:
+            choice = input("\nEnter week number (1-18): ").strip()
+            if not choice.isdecimal():
+                print("Please enter a valid number")
+            elif 1 <= (week := int(choice)) <= 18:
                 break
-            print("Please enter a valid week number (1-18)")
-        except ValueError:
-            print("Please enter a valid number")
+            else:
+                print("Please enter a valid week number (1-18)")
     
-    # Get games for selected week
-    games = await analyzer.get_games(week)
-    print("\nAvailable Games:")
-    for i, game in enumerate(games, 1):
-        home_team = game['competitions'][0]['competitors'][0]['team']['displayName']
-        away_team = game['competitions'][0]['competitors'][1]['team']['displayName']
-        print(f"{i}. {away_team} @ {home_team}")
+        # Get games for selected week
+        games = await analyzer.get_games(week)
+        print("\nAvailable Games:")
+        for i, game in enumerate(games, 1):
+            home_team = game['competitions'][0]['competitors'][0]['team']['displayName']
+            away_team = game['competitions'][0]['competitors'][1]['team']['displayName']
+            print(f"{i}. {away_team} @ {home_team}")
     
-    # Get game selection
-    while True:
-        try:
-            game_num = int(input("\nEnter game number: "))
-            if 1 <= game_num <= len(games):
+        # Get game selection
+        while True:
+            choice = input("\nEnter game number: ").strip()
+            if not choice.isdecimal():
+                print("Please enter a valid number")
+            elif 1 <= (game_num := int(choice)) <= len(games):
                 selected_game = games[game_num - 1]
                 break
-            print(f"Please enter a valid game number (1-{len(games)})")
-        except ValueError:
-            print("Please enter a valid number")
+            else:
+                print(f"Please enter a valid game number (1-{len(games)})")
     
-    try:
-        print(f"\nStarting comprehensive analysis...")
-        analyses = await analyzer.analyze_game(selected_game)
+        try:
+            print(f"\nStarting comprehensive analysis...")
+            analyses = await analyzer.analyze_game(selected_game)
         
-        print("\n📊 Final Betting Recommendations:")
-        print("================================")
-        print(analyses['final_recommendation'])
+            print("\n📊 Final Betting Recommendations:")
+            print("================================")
+            print(analyses['final_recommendation'])
         
-    except Exception as e:
-        print(f"\n❌ Error during analysis: {e}")
-        print("Please try again or contact support if the issue persists.")
+        except Exception as e:
+            print(f"\n❌ Error during analysis: {e}")
+            print("Please try again or contact support if the issue persists.")
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,37 +1,65 @@
 """
 NFL Game Analysis System - Main Execution Script
 """
+import argparse
 import asyncio
+import sys
 from pathlib import Path
 from src.analyzer import EnhancedNFLAnalyzer
 
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Analyze every NFL game in a week")
+    parser.add_argument("week_arg", nargs="?", type=int, metavar="WEEK",
+                        help="week number to analyze (1-18)")
+    parser.add_argument("--week", type=int, help="week number to analyze (1-18)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="bypass the on-disk API response cache")
+    args = parser.parse_args()
+
+    args.week = args.week if args.week is not None else args.week_arg
+    if args.week is not None and not 1 <= args.week <= 18:
+        parser.error("week must be between 1 and 18")
+    return args
+
+def prompt_for_week() -> int:
+    """Interactively ask for a week number"""
+    while True:
+        try:
+            week = int(input("\nEnter week number (1-18): "))
+            if 1 <= week <= 18:
+                return week
+            print("Please enter a valid week number (1-18)")
+        except ValueError:
+            print("Please enter a valid number")
+
 async def main():
+    args = parse_args()
+
     print("\n🏈 Enhanced NFL Game Analyzer - Version 2.0 🏈")
     print("============================================")
-    
+
     try:
-        analyzer = EnhancedNFLAnalyzer()
-        
-        # Get week selection
-        while True:
-            try:
-                week = int(input("\nEnter week number (1-18): "))
-                if 1 <= week <= 18:
-                    break
-                print("Please enter a valid week number (1-18)")
-            except ValueError:
-                print("Please enter a valid number")
-        
+        analyzer = EnhancedNFLAnalyzer(use_cache=not args.no_cache)
+
+        # Get week selection, prompting only when run interactively
+        week = args.week
+        if week is None:
+            if not sys.stdin.isatty():
+                print("\n❌ No week given; pass --week when running non-interactively")
+                return
+            week = prompt_for_week()
+
         print(f"\nStarting enhanced analysis of all games for Week {week}...")
         await analyzer.analyze_all_games_in_week(week)
         print("\n✓ Analysis complete! Check the weekly folder for results.")
-        
+
     except Exception as e:
         print(f"\n❌ Error during analysis: {e}")
         print("Please check the error message and try again.")
-        
+
     finally:
         print("\nAnalysis session completed.")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
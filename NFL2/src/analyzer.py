@@ -3,19 +3,61 @@ Enhanced NFL Analyzer module - Main orchestrator for NFL game analysis
 """
 import aiohttp
 import asyncio
+import concurrent.futures
+import functools
 import json
-import time
-import requests
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+import orjson
+from typing import Dict, List, Any, AsyncIterator, Awaitable, Callable, Optional
+from datetime import datetime, timezone
 from pathlib import Path
 
 from .data_processor import NFLDataProcessor
 from .data_validator import NFLDataValidator
+from .response_cache import NFLResponseCache
 from .statistics_analyzer import NFLStatisticsAnalyzer
 
+def _parse_json(raw: str) -> Any:
+    """Decode an API response with orjson, falling back for NaN tokens"""
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+@functools.lru_cache(maxsize=None)
+def _load_json_file(path: str) -> Dict:
+    """Read and parse a static JSON config file once per process"""
+    return orjson.loads(Path(path).read_bytes())
+
+class OllamaUnavailableError(Exception):
+    """Raised when the Ollama server can't be reached; fatal for the whole run"""
+
+# Report sections in output order: (title, analyses key)
+ANALYSIS_SECTIONS = (
+    ("DEPTH CHARTS ANALYSIS", 'depth_charts'),
+    ("WEATHER AND INJURIES ANALYSIS", 'weather_injuries'),
+    ("HOME TEAM PERFORMANCE (4 WEEKS)", 'home_last_4_weeks'),
+    ("HOME TEAM PERFORMANCE (2 WEEKS)", 'home_last_2_weeks'),
+    ("AWAY TEAM PERFORMANCE (4 WEEKS)", 'away_last_4_weeks'),
+    ("AWAY TEAM PERFORMANCE (2 WEEKS)", 'away_last_2_weeks'),
+    ("HOME TEAM DEFENSE", 'home_defense'),
+    ("AWAY TEAM DEFENSE", 'away_defense'),
+    ("TEAM DEFENSE COMPARISON", 'team_defense'),
+    ("PASS PRESSURE ANALYSIS", 'pass_pressure'),
+    ("TEAM STATS ANALYSIS", 'team_stats'),
+    ("GAME LOGS ANALYSIS", 'game_logs'),
+    ("FINAL BETTING RECOMMENDATION", 'final_recommendation')
+)
+
+SEP_MAJOR = "=" * 50
+SEP_MINOR = "=" * 30
+
+# Report body with one {key} placeholder per section, filled via format_map
+SECTIONS_TEMPLATE = "".join(
+    f"\n{title}:\n{SEP_MINOR}\n{{{key}}}\n\n" for title, key in ANALYSIS_SECTIONS
+)
+
 class EnhancedNFLAnalyzer:
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         print("\nInitializing Enhanced NFL Analyzer...")
         self.data_processor = NFLDataProcessor()
         self.data_validator = NFLDataValidator()
@@ -26,6 +68,12 @@ class EnhancedNFLAnalyzer:
         self.espn_api = "https://site.api.espn.com/apis/site/v2/sports/football/nfl"
         self.ollama_url = "http://localhost:11434/api/generate"
         
+        # API requests fail fast and retry transient errors with backoff
+        self.api_timeout = aiohttp.ClientTimeout(total=15, connect=3)
+        self.max_retries = 3
+        self.retry_delay = 0.5
+        self.max_retry_delay = 4
+        
         # Model configuration
         self.model = "llama3.2"
         self.model_params = {
@@ -35,17 +83,48 @@ class EnhancedNFLAnalyzer:
             "num_thread": 4,
             "gpu_layers": 35
         }
+        # Generations run far longer than the session's default API timeout
+        self.llm_timeout = aiohttp.ClientTimeout(total=600)
         
         # Load configurations
         self.config = self._load_config()
         self.prompts = self._load_prompts()
         self.data_contexts = self._load_data_contexts()
+        self._data_structure_cache: Dict[str, str] = {}
+        
+        # Shared HTTP session and concurrency limits: API fetches overlap
+        # freely, while LLM requests queue so the GPU isn't oversubscribed
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        self._games_cache: Dict[int, List[Dict]] = {}
+        
+        # pandas-based processing and trend analysis run off the event loop;
+        # the pool is created on first use and shut down in aclose()
+        self._cpu_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._api_sem = asyncio.Semaphore(
+            self.config.get('api', {}).get('max_concurrent_requests', 10)
+        )
+        self._llm_sem = asyncio.Semaphore(
+            self.config.get('model', {}).get('max_concurrent_requests', 2)
+        )
+        self._game_sem = asyncio.Semaphore(
+            self.config.get('analysis', {}).get('max_concurrent_games', 3)
+        )
+        
+        # Persistent API response cache
+        cache_config = self.config.get('cache', {})
+        self.response_cache = None
+        if use_cache:
+            self.response_cache = NFLResponseCache(
+                cache_config.get('path', 'cache/api_responses.db'),
+                cache_config.get('default_ttl_seconds'),
+                cache_config.get('ttl_seconds', {})
+            )
 
     def _load_config(self) -> Dict:
         """Load configuration from file"""
         try:
-            with open(Path('config/config.json'), 'r') as f:
-                return json.load(f)
+            return _load_json_file('config/config.json')
         except Exception as e:
             print(f"Error loading config: {e}")
             raise
@@ -53,8 +132,7 @@ class EnhancedNFLAnalyzer:
     def _load_prompts(self) -> Dict:
         """Load enhanced prompts from file"""
         try:
-            with open(Path('config/enhanced_prompts.json'), 'r') as f:
-                return json.load(f)
+            return _load_json_file('config/enhanced_prompts.json')
         except Exception as e:
             print(f"Error loading prompts: {e}")
             raise
@@ -62,75 +140,195 @@ class EnhancedNFLAnalyzer:
     def _load_data_contexts(self) -> Dict:
         """Load data contexts from file"""
         try:
-            with open(Path('config/data_contexts.json'), 'r') as f:
-                return json.load(f)
+            return _load_json_file('config/data_contexts.json')
         except Exception as e:
             print(f"Error loading data contexts: {e}")
             raise
 
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100, limit_per_host=20, ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session and the CPU worker pool"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown(wait=False)
+            self._cpu_pool = None
+
     async def get_data(self, endpoint: str, params: dict = None) -> Dict:
-        """Enhanced data retrieval with validation"""
+        """Enhanced data retrieval with validation, coalescing identical in-flight calls"""
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_data(endpoint, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            
+        # Shield the shared fetch so one cancelled caller doesn't cancel the rest
+        return await asyncio.shield(task)
+
+    async def _fetch_data(self, endpoint: str, params: Optional[dict]) -> Dict:
+        """Fetch one endpoint from the cache or the API"""
         url = f"{self.api_base}/{endpoint}"
+        
+        if self.response_cache is not None:
+            cached = await self.response_cache.get(endpoint, params)
+            if cached is not None:
+                print(f"Using cached data for: {url} {params}")
+                return cached
+        
         print(f"Fetching data from: {url}")
         print(f"Parameters: {params}")
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, params=params) as response:
-                    if response.status != 200:
-                        raise Exception(f"API returned status code {response.status}")
-                        
-                    data = await response.json()
+        session = await self._ensure_session()
+        try:
+            for attempt in range(self.max_retries):
+                try:
+                    async with self._api_sem:
+                        async with session.get(url, params=params,
+                                               timeout=self.api_timeout) as response:
+                            if response.status == 429 or response.status >= 500:
+                                raise aiohttp.ClientResponseError(
+                                    response.request_info, response.history,
+                                    status=response.status,
+                                    message=f"API returned status code {response.status}"
+                                )
+                            if response.status != 200:
+                                raise Exception(f"API returned status code {response.status}")
+                                
+                            data = await response.json(loads=_parse_json)
+                    break
                     
-                    # Validate data
-                    valid, message = self.data_validator.validate_api_response(data, endpoint)
-                    if not valid:
-                        raise Exception(f"Data validation failed: {message}")
-                        
-                    return data
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    # Only 429/5xx statuses are worth retrying; a bad body or content type
+                    # on a 200 (e.g. ContentTypeError) won't change on the next attempt
+                    if (isinstance(e, aiohttp.ClientResponseError)
+                            and e.status != 429 and e.status < 500):
+                        raise Exception(f"Invalid response from {endpoint}: {str(e)}") from e
+                    if attempt == self.max_retries - 1:
+                        raise Exception(
+                            f"{endpoint} unavailable after {self.max_retries} attempts: {str(e)}"
+                        )
                     
-            except Exception as e:
-                print(f"Error fetching data from {endpoint}: {str(e)}")
-                raise
+                    # Back off outside the semaphore so other requests can proceed
+                    delay = min(self.retry_delay * 2 ** attempt, self.max_retry_delay)
+                    print(f"⚠️  {endpoint} request failed ({str(e)}), retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+            
+            # Validate data
+            valid, message = self.data_validator.validate_api_response(data, endpoint)
+            if not valid:
+                raise Exception(f"Data validation failed: {message}")
+            
+            if self.response_cache is not None:
+                await self.response_cache.set(endpoint, params, data)
+                
+            return data
+            
+        except Exception as e:
+            print(f"Error fetching data from {endpoint}: {str(e)}")
+            raise
 
-    async def get_llama_response(self, prompt_template: str, data: Dict, context: Dict) -> str:
-        """Enhanced LLM interaction with better context"""
-        try:
-            # Create enhanced system context
-            system_context = {
-                "role": "NFL Analysis System",
-                "game_context": context,
-                "data_structure": self.data_contexts.get(context.get('data_type', ''), {}),
-                "analysis_requirements": self.config.get('analysis_requirements', {})
-            }
+    async def _run_cpu(self, func: Callable, *args) -> Any:
+        """Run CPU-bound analysis in the worker pool so the event loop stays responsive"""
+        if self._cpu_pool is None:
+            self._cpu_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._cpu_pool, func, *args)
 
-            # Format prompt with all necessary context
-            formatted_prompt = prompt_template.format(
-                game_context=json.dumps(context, indent=2),
-                data_structure=json.dumps(system_context['data_structure'], indent=2),
-                data=json.dumps(data, indent=2)
-            )
+    def _data_structure_json(self, data_type: str) -> str:
+        """Serialized data structure description for a data type, built once"""
+        if data_type not in self._data_structure_cache:
+            self._data_structure_cache[data_type] = orjson.dumps(
+                self.data_contexts.get(data_type, {})
+            ).decode()
+        return self._data_structure_cache[data_type]
 
-            # Make request to Ollama
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: requests.post(
-                    self.ollama_url,
-                    json={
-                        "model": self.model,
-                        "prompt": formatted_prompt,
-                        "system": json.dumps(system_context),
-                        "stream": False,
-                        "context": [],
-                        **self.model_params
-                    }
-                )
-            )
+    def _build_llm_payload(self, prompt_template: str, data: Dict, context: Dict,
+                           data_type: str, details: Optional[Dict] = None,
+                           prompt_fields: Optional[Dict[str, str]] = None) -> Dict:
+        """Build the Ollama request body with the enhanced system context"""
+        # The shared game context is only merged with per-analysis fields here
+        context = {**context, 'data_type': data_type, **(details or {})}
+        
+        # Create enhanced system context
+        system_context = {
+            "role": "NFL Analysis System",
+            "game_context": context,
+            "data_structure": self.data_contexts.get(data_type, {}),
+            "analysis_requirements": self.config.get('analysis_requirements', {})
+        }
 
-            if response.status_code != 200:
-                raise Exception(f"Ollama API returned status code {response.status_code}")
+        # Format prompt with all necessary context; compact JSON keeps the
+        # prompt (and the model's token count) small
+        formatted_prompt = prompt_template.format(
+            game_context=orjson.dumps(context).decode(),
+            data_structure=self._data_structure_json(data_type),
+            data=orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode(),
+            **(prompt_fields or {})
+        )
 
-            return response.json()['response']
+        return {
+            "model": self.model,
+            "prompt": formatted_prompt,
+            "system": orjson.dumps(system_context).decode(),
+            "stream": True,
+            "context": [],
+            **self.model_params
+        }
+
+    async def stream_llama_response(self, prompt_template: str, data: Dict, context: Dict,
+                                    data_type: str, details: Optional[Dict] = None,
+                                    prompt_fields: Optional[Dict[str, str]] = None
+                                    ) -> AsyncIterator[str]:
+        """Stream LLM output from Ollama as text pieces arrive"""
+        payload = self._build_llm_payload(prompt_template, data, context, data_type,
+                                          details, prompt_fields)
+        session = await self._ensure_session()
+        async with self._llm_sem:
+            try:
+                async with session.post(self.ollama_url, json=payload,
+                                        timeout=self.llm_timeout) as response:
+                    if response.status != 200:
+                        raise Exception(f"Ollama API returned status code {response.status}")
+
+                    # Ollama streams one JSON object per line
+                    async for line in response.content:
+                        if not line.strip():
+                            continue
+                        chunk = orjson.loads(line)
+                        if 'error' in chunk:
+                            raise Exception(f"Ollama error: {chunk['error']}")
+                        if chunk.get('response'):
+                            yield chunk['response']
+                        if chunk.get('done'):
+                            break
+                            
+            except aiohttp.ClientConnectionError as e:
+                raise OllamaUnavailableError(
+                    f"Cannot reach Ollama at {self.ollama_url}: {str(e)}"
+                ) from e
+
+    async def get_llama_response(self, prompt_template: str, data: Dict, context: Dict,
+                                 data_type: str, details: Optional[Dict] = None,
+                                 prompt_fields: Optional[Dict[str, str]] = None) -> str:
+        """Enhanced LLM interaction with better context"""
+        try:
+            return "".join([
+                piece async for piece in
+                self.stream_llama_response(prompt_template, data, context, data_type,
+                                           details, prompt_fields)
+            ])
 
         except Exception as e:
             print(f"Error getting LLM response: {str(e)}")
@@ -147,17 +345,22 @@ class EnhancedNFLAnalyzer:
         
         home_depth, away_depth = await asyncio.gather(*tasks)
         
-        # Process data
+        # Process data (pandas) in the worker pool
+        home_depth, away_depth = await asyncio.gather(
+            self._run_cpu(self.data_processor.process_depth_chart, home_depth),
+            self._run_cpu(self.data_processor.process_depth_chart, away_depth)
+        )
         processed_data = {
-            'home_depth': self.data_processor.process_depth_chart(home_depth),
-            'away_depth': self.data_processor.process_depth_chart(away_depth)
+            'home_depth': home_depth,
+            'away_depth': away_depth
         }
         
         # Get analysis from LLM
         analysis = await self.get_llama_response(
             self.prompts["depth_charts"]["template"],
             processed_data,
-            {**context, 'data_type': 'depth_chart'}
+            context,
+            'depth_chart'
         )
         
         return analysis
@@ -174,18 +377,23 @@ class EnhancedNFLAnalyzer:
         
         weather, home_injuries, away_injuries = await asyncio.gather(*tasks)
         
-        # Process data
+        # Process data; the injury reports go through pandas in the worker pool
+        home_injuries, away_injuries = await asyncio.gather(
+            self._run_cpu(self.data_processor.process_injuries, home_injuries),
+            self._run_cpu(self.data_processor.process_injuries, away_injuries)
+        )
         processed_data = {
             'weather': self.data_processor.process_weather(weather),
-            'home_injuries': self.data_processor.process_injuries(home_injuries),
-            'away_injuries': self.data_processor.process_injuries(away_injuries)
+            'home_injuries': home_injuries,
+            'away_injuries': away_injuries
         }
         
         # Get analysis
         analysis = await self.get_llama_response(
             self.prompts["weather_injuries"]["template"],
             processed_data,
-            {**context, 'data_type': 'weather_injuries'}
+            context,
+            'weather_injuries'
         )
         
         return analysis
@@ -204,29 +412,28 @@ class EnhancedNFLAnalyzer:
         
         passing, rushing, receiving = await asyncio.gather(*tasks)
         
-        # Process data
+        # Process data (pandas) in the worker pool
+        passing, rushing, receiving = await asyncio.gather(
+            self._run_cpu(self.data_processor.process_player_stats, passing, 'Passing'),
+            self._run_cpu(self.data_processor.process_player_stats, rushing, 'Rushing'),
+            self._run_cpu(self.data_processor.process_player_stats, receiving, 'Receiving')
+        )
         processed_data = {
-            'passing': self.data_processor.process_player_stats(passing, 'Passing'),
-            'rushing': self.data_processor.process_player_stats(rushing, 'Rushing'),
-            'receiving': self.data_processor.process_player_stats(receiving, 'Receiving')
+            'passing': passing,
+            'rushing': rushing,
+            'receiving': receiving
         }
         
         # Analyze trends
-        performance_trends = self.stats_analyzer.analyze_team_performance(processed_data)
+        performance_trends = await self._run_cpu(self.stats_analyzer.analyze_team_performance, processed_data)
         
         # Get analysis from LLM
-        analysis_context = {
-            **context,
-            'data_type': 'team_performance',
-            'period': period,
-            'is_home': is_home,
-            'team': team
-        }
-        
         analysis = await self.get_llama_response(
             self.prompts["team_performance"]["template"],
             {**processed_data, 'trends': performance_trends},
-            analysis_context
+            context,
+            'team_performance',
+            {'period': period, 'is_home': is_home, 'team': team}
         )
         
         return analysis
@@ -245,27 +452,26 @@ class EnhancedNFLAnalyzer:
         
         defense_2wk, defense_4wk = await asyncio.gather(*tasks)
         
-        # Process data
+        # Process data (pandas) in the worker pool
+        recent, extended = await asyncio.gather(
+            self._run_cpu(self.data_processor.process_player_stats, defense_2wk, 'Defensive'),
+            self._run_cpu(self.data_processor.process_player_stats, defense_4wk, 'Defensive')
+        )
         processed_data = {
-            'recent': self.data_processor.process_player_stats(defense_2wk, 'Defensive'),
-            'extended': self.data_processor.process_player_stats(defense_4wk, 'Defensive')
+            'recent': recent,
+            'extended': extended
         }
         
         # Analyze trends
-        defensive_trends = self.stats_analyzer.analyze_defensive_performance(processed_data)
+        defensive_trends = await self._run_cpu(self.stats_analyzer.analyze_defensive_performance, processed_data)
         
         # Get analysis from LLM
-        analysis_context = {
-            **context,
-            'data_type': 'defense',
-            'is_home': is_home,
-            'team': team
-        }
-        
         analysis = await self.get_llama_response(
             self.prompts["defense"]["template"],
             {**processed_data, 'trends': defensive_trends},
-            analysis_context
+            context,
+            'defense',
+            {'is_home': is_home, 'team': team}
         )
         
         return analysis
@@ -291,7 +497,8 @@ class EnhancedNFLAnalyzer:
         analysis = await self.get_llama_response(
             self.prompts["team_defense"]["template"],
             processed_data,
-            {**context, 'data_type': 'team_defense'}
+            context,
+            'team_defense'
         )
         
         return analysis
@@ -317,7 +524,8 @@ class EnhancedNFLAnalyzer:
         analysis = await self.get_llama_response(
             self.prompts["pass_pressure"]["template"],
             processed_data,
-            {**context, 'data_type': 'pass_pressure'}
+            context,
+            'pass_pressure'
         )
         
         return analysis
@@ -333,17 +541,22 @@ class EnhancedNFLAnalyzer:
         
         home_stats, away_stats = await asyncio.gather(*tasks)
         
-        # Process data
+        # Process data (pandas) in the worker pool
+        home_stats, away_stats = await asyncio.gather(
+            self._run_cpu(self.data_processor.process_team_stats, home_stats),
+            self._run_cpu(self.data_processor.process_team_stats, away_stats)
+        )
         processed_data = {
-            'home_stats': self.data_processor.process_team_stats(home_stats),
-            'away_stats': self.data_processor.process_team_stats(away_stats)
+            'home_stats': home_stats,
+            'away_stats': away_stats
         }
         
         # Get analysis
         analysis = await self.get_llama_response(
             self.prompts["team_stats"]["template"],
             processed_data,
-            {**context, 'data_type': 'team_stats'}
+            context,
+            'team_stats'
         )
         
         return analysis
@@ -361,146 +574,146 @@ class EnhancedNFLAnalyzer:
         
         home_logs, away_logs, home_opp, away_opp = await asyncio.gather(*tasks)
         
-        # Process data
-        processed_data = {
-            'home_logs': self.data_processor.process_game_logs(home_logs),
-            'away_logs': self.data_processor.process_game_logs(away_logs),
-            'home_opp': self.data_processor.process_game_logs(home_opp),
-            'away_opp': self.data_processor.process_game_logs(away_opp)
-        }
-        
-        # Analyze trends
-        game_trends = self.stats_analyzer.analyze_game_trends(processed_data)
+        # Process data into flat DataFrames in the worker pool
+        logs = await asyncio.gather(*(
+            self._run_cpu(self.data_processor.process_game_logs, raw_logs)
+            for raw_logs in (home_logs, away_logs, home_opp, away_opp)
+        ))
+        processed_data = dict(zip(('home_logs', 'away_logs', 'home_opp', 'away_opp'), logs))
+        
+        # Analyze trends straight from each team's DataFrame
+        home_trends, away_trends = await asyncio.gather(
+            self._run_cpu(self.stats_analyzer.analyze_game_trends, processed_data['home_logs']),
+            self._run_cpu(self.stats_analyzer.analyze_game_trends, processed_data['away_logs'])
+        )
         
         # Get analysis
         analysis = await self.get_llama_response(
             self.prompts["game_logs"]["template"],
-            {**processed_data, 'trends': game_trends},
-            {**context, 'data_type': 'game_logs'}
+            {
+                **{key: df.to_dict('records') for key, df in processed_data.items()},
+                'trends': {'home': home_trends, 'away': away_trends}
+            },
+            context,
+            'game_logs'
         )
         
         return analysis
 
-    async def get_final_recommendation(self, analyses: Dict[str, str], game_data: Dict) -> str:
+    @staticmethod
+    def _iter_previous_analyses(analyses: Dict[str, str]):
+        """Yield (section title, text) for each completed analysis, in report order"""
+        for title, key in ANALYSIS_SECTIONS:
+            if key in analyses:
+                yield title, analyses[key]
+
+    async def get_final_recommendation(self, analyses: Dict[str, str], game_data: Dict,
+                                       context: Dict) -> str:
         """Generate comprehensive final betting recommendations"""
         try:
-            context = {
-                'game_id': game_data['id'],
-                'home_team': game_data['competitions'][0]['competitors'][0]['team']['displayName'],
-                'away_team': game_data['competitions'][0]['competitors'][1]['team']['displayName'],
-                'venue': game_data['competitions'][0]['venue']['fullName'],
-                'date': game_data['date'],
-                'data_type': 'final_analysis'
-            }
-
-            # Get odds data
+            # Get odds data; the recommendation is weighed against the market line
             odds = await self._get_game_odds(game_data)
             
-            # Structure all analyses
-            structured_analyses = {
-                "depth_charts": analyses['depth_charts'],
-                "weather_injuries": analyses['weather_injuries'],
-                "team_performance": {
-                    "home": {
-                        "last_4_weeks": analyses['home_last_4_weeks'],
-                        "last_2_weeks": analyses['home_last_2_weeks']
-                    },
-                    "away":
-                    {
-                        "last_4_weeks": analyses['away_last_4_weeks'],
-                        "last_2_weeks": analyses['away_last_2_weeks']
-                    }
-                },
-                "defense": {
-                    "home": analyses['home_defense'],
-                    "away": analyses['away_defense'],
-                    "comparison": analyses['team_defense']
-                },
-                "advanced_stats": {
-                    "pass_pressure": analyses['pass_pressure'],
-                    "team_stats": analyses['team_stats']
-                },
-                "game_logs": analyses['game_logs']
-            }
-            
-            # Calculate win probabilities
-            win_probs = self.stats_analyzer.calculate_win_probability(
-                structured_analyses['team_performance']['home'],
-                structured_analyses['team_performance']['away'],
-                {'weather': analyses['weather_injuries']}
+            # The earlier analyses go into the prompt as plain-text sections
+            # rather than JSON-quoted strings
+            previous_analyses = "\n".join(
+                f"=== {title} ===\n{text}\n"
+                for title, text in self._iter_previous_analyses(analyses)
             )
             
-            # Prepare final analysis context
-            final_context = {
-                **context,
-                'odds': odds,
-                'win_probability': win_probs,
-                'analyses': structured_analyses
-            }
-            
             # Get final recommendation
             return await self.get_llama_response(
                 self.prompts["final_analysis"]["template"],
-                final_context,
-                context
+                {'odds': odds},
+                context,
+                'final_analysis',
+                prompt_fields={
+                    'home_team': context['home_team'],
+                    'away_team': context['away_team'],
+                    'venue': context['venue'],
+                    'date': context['date'],
+                    'odds': self._format_odds(odds),
+                    'previous_analyses': previous_analyses
+                }
             )
             
         except Exception as e:
             print(f"Error in final recommendation: {str(e)}")
             raise
 
+    async def _run_tasks(self, *coros: Awaitable) -> List[Any]:
+        """Run coroutines concurrently, cancelling the rest as soon as one fails"""
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(coro) for coro in coros]
+        except ExceptionGroup as group:
+            # Surface the underlying failure instead of the group wrapper
+            raise group.exceptions[0]
+        return [task.result() for task in tasks]
+
+    async def _run_analysis(self, name: str, coro: Awaitable[str]) -> str:
+        """Await one sub-analysis, recording non-fatal failures in place of its text"""
+        try:
+            return await coro
+        except OllamaUnavailableError:
+            raise
+        except Exception as e:
+            print(f"Error in {name} analysis: {str(e)}")
+            return f"Analysis unavailable: {str(e)}"
+
+    @staticmethod
+    def _extract_context(game_data: Dict) -> Dict:
+        """Pull the shared game context out of an ESPN event"""
+        competition = game_data['competitions'][0]
+        home, away = competition['competitors'][0], competition['competitors'][1]
+        return {
+            'game_id': game_data['id'],
+            'home_team': home['team']['displayName'],
+            'away_team': away['team']['displayName'],
+            'venue': competition['venue']['fullName'],
+            'date': game_data['date']
+        }
+
     async def analyze_game(self, game_data: Dict) -> Dict[str, str]:
         """Complete enhanced game analysis"""
         try:
-            # Extract game context
-            context = {
-                'game_id': game_data['id'],
-                'home_team': game_data['competitions'][0]['competitors'][0]['team']['displayName'],
-                'away_team': game_data['competitions'][0]['competitors'][1]['team']['displayName'],
-                'venue': game_data['competitions'][0]['venue']['fullName'],
-                'date': game_data['date']
-            }
+            # Extract game context once; every analysis shares it read-only
+            context = self._extract_context(game_data)
 
             # Run all analyses
             analyses = {}
             
             print(f"\nAnalyzing {context['away_team']} @ {context['home_team']}")
             
-            # Core analyses
-            analyses['depth_charts'] = await self.analyze_depth_charts(context)
-            analyses['weather_injuries'] = await self.analyze_weather_injuries(context)
-            
-            # Team performance analyses
-            analyses['home_last_4_weeks'] = await self.analyze_team_performance(
-                context['home_team'], "Last 4 Weeks", True, context
-            )
-            analyses['home_last_2_weeks'] = await self.analyze_team_performance(
-                context['home_team'], "Last 2 Weeks", True, context
-            )
-            analyses['away_last_4_weeks'] = await self.analyze_team_performance(
-                context['away_team'], "Last 4 Weeks", False, context
-            )
-            analyses['away_last_2_weeks'] = await self.analyze_team_performance(
-                context['away_team'], "Last 2 Weeks", False, context
-            )
-            
-            # Defensive analyses
-            analyses['home_defense'] = await self.analyze_defense(
-                context['home_team'], True, context
-            )
-            analyses['away_defense'] = await self.analyze_defense(
-                context['away_team'], False, context
-            )
-            analyses['team_defense'] = await self.analyze_team_defense(context)
-            
-            # Additional analyses
-            analyses['pass_pressure'] = await self.analyze_pass_pressure(context)
-            analyses['team_stats'] = await self.analyze_team_stats(context)
-            analyses['game_logs'] = await self.analyze_game_logs(context)
+            # Every sub-analysis is independent I/O, so launch them all at once;
+            # a failing branch is recorded instead of aborting the whole game
+            home_team, away_team = context['home_team'], context['away_team']
+            coros = {
+                'depth_charts': self.analyze_depth_charts(context),
+                'weather_injuries': self.analyze_weather_injuries(context),
+                'home_last_4_weeks': self.analyze_team_performance(
+                    home_team, "Last 4 Weeks", True, context),
+                'home_last_2_weeks': self.analyze_team_performance(
+                    home_team, "Last 2 Weeks", True, context),
+                'away_last_4_weeks': self.analyze_team_performance(
+                    away_team, "Last 4 Weeks", False, context),
+                'away_last_2_weeks': self.analyze_team_performance(
+                    away_team, "Last 2 Weeks", False, context),
+                'home_defense': self.analyze_defense(home_team, True, context),
+                'away_defense': self.analyze_defense(away_team, False, context),
+                'team_defense': self.analyze_team_defense(context),
+                'pass_pressure': self.analyze_pass_pressure(context),
+                'team_stats': self.analyze_team_stats(context),
+                'game_logs': self.analyze_game_logs(context)
+            }
+            results = await self._run_tasks(*(
+                self._run_analysis(name, coro) for name, coro in coros.items()
+            ))
+            analyses.update(zip(coros, results))
             
             # Final recommendation
             analyses['final_recommendation'] = await self.get_final_recommendation(
-                analyses, game_data
+                analyses, game_data, context
             )
             
             return analyses
@@ -521,61 +734,115 @@ class EnhancedNFLAnalyzer:
         
         print(f"\nFound {total_games} games for Week {week}")
         
-        for i, game in enumerate(games, 1):
-            try:
-                print(f"\nAnalyzing game {i}/{total_games}")
+        # A few games run at once to fill LLM idle gaps; the API/LLM
+        # semaphores bound the actual load
+        try:
+            await self._run_tasks(*(
+                self._analyze_and_save(game, week_dir, i, total_games)
+                for i, game in enumerate(games, 1)
+            ))
+        finally:
+            await self.aclose()
+
+    async def _analyze_and_save(self, game: Dict, week_dir: Path,
+                                game_num: int, total_games: int) -> None:
+        """Analyze one game and save it, logging rather than raising on non-fatal failure"""
+        try:
+            async with self._game_sem:
+                print(f"\nAnalyzing game {game_num}/{total_games}")
                 analyses = await self.analyze_game(game)
                 
                 # Save analyses
-                self._save_analysis_to_file(analyses, game, week_dir, i, total_games)
-                
-            except Exception as e:
-                print(f"❌ Error analyzing game {i}: {str(e)}")
-                continue
+                await self._save_analysis_to_file(analyses, game, week_dir, game_num, total_games)
+            
+        except OllamaUnavailableError:
+            raise
+        except Exception as e:
+            print(f"❌ Error analyzing game {game_num}: {str(e)}")
 
     async def _get_games(self, week: int) -> List[Dict]:
-        """Get games for specified week"""
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.espn_api}/scoreboard"
-            params = {"week": week, "seasontype": 2}
+        """Get games for specified week, reusing an already-fetched scoreboard"""
+        if week in self._games_cache:
+            return self._games_cache[week]
+        
+        params = {"week": week, "seasontype": 2}
+        if self.response_cache is not None:
+            cached = await self.response_cache.get("scoreboard", params)
+            if cached is not None:
+                self._games_cache[week] = cached
+                return cached
+        
+        session = await self._ensure_session()
+        url = f"{self.espn_api}/scoreboard"
+        
+        async with session.get(url, params=params) as response:
+            if response.status != 200:
+                raise Exception(f"ESPN API returned status {response.status}")
+                
+            data = await response.json(loads=_parse_json)
             
-            async with session.get(url, params=params) as response:
-                if response.status != 200:
-                    raise Exception(f"ESPN API returned status {response.status}")
-                    
-                data = await response.json()
-                return data.get('events', [])
+        games = data.get('events', [])
+        self._games_cache[week] = games
+        if self.response_cache is not None:
+            await self.response_cache.set("scoreboard", params, games)
+        return games
+
+    @staticmethod
+    def _format_odds(odds: Dict) -> str:
+        """Render processed odds as prompt lines"""
+        if not odds:
+            return "- Odds unavailable"
+        return (
+            f"- Spread: {odds.get('spread')}\n"
+            f"- Over/Under: {odds.get('over_under')}\n"
+            f"- Moneyline: Home {odds.get('home_line')}, Away {odds.get('away_line')}"
+        )
 
     async def _get_game_odds(self, game_data: Dict) -> Dict:
         """Get odds data for a game"""
         try:
             game_id = game_data['id']
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.espn_api}/scoreboard/{game_id}/odds"
-                
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        return {}
-                        
-                    data = await response.json()
+            cache_params = {"game_id": game_id}
+            if self.response_cache is not None:
+                cached = await self.response_cache.get("odds", cache_params)
+                if cached is not None:
+                    return cached
+            
+            session = await self._ensure_session()
+            url = f"{self.espn_api}/scoreboard/{game_id}/odds"
+            
+            async with session.get(url) as response:
+                if response.status != 200:
+                    return {}
                     
-                    # Process odds data
-                    if not data.get('items'):
-                        return {}
-                        
-                    odds = data['items'][0]
-                    return {
-                        'spread': odds.get('spread', 0),
-                        'over_under': odds.get('overUnder', 0),
-                        'home_line': odds.get('homeTeamOdds', {}).get('moneyLine', 0),
-                        'away_line': odds.get('awayTeamOdds', {}).get('moneyLine', 0)
-                    }
+                data = await response.json(loads=_parse_json)
+                
+            # Process odds data
+            if not data.get('items'):
+                return {}
+                
+            odds = data['items'][0]
+            processed = {
+                'spread': odds.get('spread', 0),
+                'over_under': odds.get('overUnder', 0),
+                'home_line': odds.get('homeTeamOdds', {}).get('moneyLine', 0),
+                'away_line': odds.get('awayTeamOdds', {}).get('moneyLine', 0)
+            }
+            
+            # Lines are final once the game kicks off; before that they still move
+            if self.response_cache is not None:
+                kickoff = datetime.fromisoformat(game_data['date'].replace('Z', '+00:00'))
+                started = kickoff <= datetime.now(timezone.utc)
+                await self.response_cache.set(
+                    "odds", cache_params, processed, None if started else 3600
+                )
+            return processed
                     
         except Exception as e:
             print(f"Error getting odds: {str(e)}")
             return {}
 
-    def _save_analysis_to_file(self, analyses: Dict, game: Dict, 
+    async def _save_analysis_to_file(self, analyses: Dict, game: Dict, 
                              week_dir: Path, game_num: int, total_games: int) -> None:
         """Save analysis results to file"""
         home_team = game['competitions'][0]['competitors'][0]['team']['displayName']
@@ -583,33 +850,16 @@ class EnhancedNFLAnalyzer:
         
         filename = week_dir / f"{away_team} @ {home_team} Analysis.txt"
         
-        with open(filename, 'w') as f:
-            f.write(f"NFL Game Analysis - Week {game['week']}\n")
-            f.write(f"{away_team} @ {home_team}\n")
-            f.write(f"Venue: {game['competitions'][0]['venue']['fullName']}\n")
-            f.write(f"Date: {game['date']}\n")
-            f.write("=" * 50 + "\n\n")
-            
-            # Write each analysis section
-            sections = [
-                ("DEPTH CHARTS ANALYSIS", 'depth_charts'),
-                ("WEATHER AND INJURIES ANALYSIS", 'weather_injuries'),
-                ("HOME TEAM PERFORMANCE (4 WEEKS)", 'home_last_4_weeks'),
-                ("HOME TEAM PERFORMANCE (2 WEEKS)", 'home_last_2_weeks'),
-                ("AWAY TEAM PERFORMANCE (4 WEEKS)", 'away_last_4_weeks'),
-                ("AWAY TEAM PERFORMANCE (2 WEEKS)", 'away_last_2_weeks'),
-                ("HOME TEAM DEFENSE", 'home_defense'),
-                ("AWAY TEAM DEFENSE", 'away_defense'),
-                ("TEAM DEFENSE COMPARISON", 'team_defense'),
-                ("PASS PRESSURE ANALYSIS", 'pass_pressure'),
-                ("TEAM STATS ANALYSIS", 'team_stats'),
-                ("GAME LOGS ANALYSIS", 'game_logs'),
-                ("FINAL BETTING RECOMMENDATION", 'final_recommendation')
-            ]
-            
-            for title, key in sections:
-                f.write(f"\n{title}:\n")
-                f.write("=" * 30 + "\n")
-                f.write(f"{analyses[key]}\n\n")
+        content = (
+            f"NFL Game Analysis - Week {game['week']}\n"
+            f"{away_team} @ {home_team}\n"
+            f"Venue: {game['competitions'][0]['venue']['fullName']}\n"
+            f"Date: {game['date']}\n"
+            f"{SEP_MAJOR}\n\n"
+            + SECTIONS_TEMPLATE.format_map(analyses)
+        )
+        
+        # One write, off the event loop so concurrent games don't stall
+        await asyncio.to_thread(filename.write_text, content)
 
-        print(f"✓ Analysis {game_num}/{total_games} saved to: {filename}")
\ No newline at end of file
+        print(f"✓ Analysis {game_num}/{total_games} saved to: {filename}")
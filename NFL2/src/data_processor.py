@@ -5,6 +5,39 @@ import pandas as pd
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+# (output key, API key, default) schemas for single-row payloads
+WEATHER_FIELDS = (
+    ('temperature', 'Temperature', 'N/A'),
+    ('precipitation', 'Precipitation Chance', '0%'),
+    ('wind_speed', 'Wind Speed', 0),
+    ('wind_direction', 'Wind Direction', 'N/A'),
+    ('conditions', 'Weather Condition', 'N/A')
+)
+TEAM_DEFENSE_FIELDS = (
+    ('points_against', 'Points_Against', 0),
+    ('total_yards', 'Total_Yards', 0),
+    ('passing_yards', 'Passing_Yards', 0),
+    ('rushing_yards', 'Rushing_Yards', 0),
+    ('turnovers', 'Tot_Yds_TO_Turnovers', 0),
+    ('sacks', 'Passing_Sacks', 0)
+)
+PASS_PRESSURE_FIELDS = (
+    ('blitzes', 'Passing Bltz', 0),
+    ('hits', 'Passing Hits', 0),
+    ('hurries', 'Passing Hrry', 0),
+    ('pressure_pct', 'Passing Prss%', '0%'),
+    ('pocket_time', 'Passing PktTime', 0)
+)
+TEAM_STAT_FIELDS = (
+    ('current', '2024', '0'),
+    ('previous', '2023', '0'),
+    ('home', 'Home', '0'),
+    ('away', 'Away', '0'),
+    ('last_game', 'Last 1', '0'),
+    ('last_three', 'Last 3', '0'),
+    ('rank', 'Rank', 0)
+)
+
 class NFLDataProcessor:
     def __init__(self):
         self.stat_mappings = {
@@ -12,155 +45,180 @@ class NFLDataProcessor:
             'Rushing': ['ATT', 'YDS', 'TD', 'AVG'],
             'Receiving': ['REC', 'TGT', 'YDS', 'TD', 'AVG']
         }
+        
+        # API column names per stat type, built once
+        self._stat_keys = {
+            stat_type: [f'{stat_type} Last 4 Weeks {metric}' for metric in metrics]
+            for stat_type, metrics in self.stat_mappings.items()
+        }
+        self._att_keys = {
+            stat_type: f'{stat_type} Last 4 Weeks ATT' for stat_type in self.stat_mappings
+        }
+        
+        # API column -> output key renames
+        self.depth_chart_columns = {
+            'Starter': 'starter',
+            '2ND': 'second_string',
+            '3RD': 'third_string',
+            '4TH': 'fourth_string',
+            'Section': 'section'
+        }
+        self.game_log_columns = {
+            'Date': 'date',
+            'Opp': 'opponent',
+            'Location': 'location',
+            'Score_Tm': 'score_team',
+            'Score_Opp': 'score_opp',
+            'Passing_Yds': 'passing_yards',
+            'Rushing_Yds': 'rushing_yards',
+            'Downs_3DAtt': 'third_down_att',
+            'Downs_3DConv': 'third_down_conv',
+            'ToP': 'top'
+        }
+        self.injury_columns = {
+            'Name': 'name',
+            'Pos': 'position',
+            'Injury': 'injury',
+            'Details': 'details',
+            'Updated': 'updated'
+        }
 
     def process_depth_chart(self, raw_data: List[Dict]) -> Dict[str, Dict]:
         """Process depth chart data into organized structure"""
-        processed = {}
-        for entry in raw_data:
-            position = entry.get('Position', '')
-            if position:
-                processed[position] = {
-                    'starter': entry.get('Starter', ''),
-                    'second_string': entry.get('2ND', ''),
-                    'third_string': entry.get('3RD', ''),
-                    'fourth_string': entry.get('4TH', ''),
-                    'section': entry.get('Section', '')
-                }
-        return processed
+        df = pd.DataFrame(raw_data).reindex(
+            columns=['Position', *self.depth_chart_columns], fill_value=''
+        ).fillna('').rename(columns=self.depth_chart_columns)
+        
+        # Later rows win for a repeated position, as with a dict build
+        df = df[df['Position'].astype(bool)].drop_duplicates('Position', keep='last')
+        return df.set_index('Position').to_dict('index')
 
     def process_weather(self, raw_data: List[Dict]) -> Dict:
         """Process weather data"""
         if not raw_data:
             return {}
             
-        weather = raw_data[0]
-        return {
-            'temperature': weather.get('Temperature', 'N/A'),
-            'precipitation': weather.get('Precipitation Chance', '0%'),
-            'wind_speed': weather.get('Wind Speed', 0),
-            'wind_direction': weather.get('Wind Direction', 'N/A'),
-            'conditions': weather.get('Weather Condition', 'N/A')
-        }
+        return self._extract_fields(raw_data[0], WEATHER_FIELDS)
 
-    def process_injuries(self, raw_data: List[Dict]) -> Dict[str, List]:
-        """Process injury report data"""
-        processed = {'OUT': [], 'QUESTIONABLE': [], 'DOUBTFUL': [], 'IR': []}
+    def process_injuries(self, raw_data: List[Dict]) -> Dict[str, Dict[str, List]]:
+        """Process injury report data into per-status columns (field -> list of values)"""
+        columns = list(self.injury_columns.values())
+        processed = {
+            status: {col: [] for col in columns}
+            for status in ('OUT', 'QUESTIONABLE', 'DOUBTFUL', 'IR')
+        }
         
-        for injury in raw_data:
-            status = injury.get('Status', 'UNKNOWN')
-            player_info = {
-                'name': injury.get('Name', ''),
-                'position': injury.get('Pos', ''),
-                'injury': injury.get('Injury', ''),
-                'details': injury.get('Details', ''),
-                'updated': injury.get('Updated', '')
-            }
-            
-            if status in processed:
-                processed[status].append(player_info)
+        df = pd.DataFrame(raw_data).reindex(
+            columns=['Status', *self.injury_columns], fill_value=''
+        ).fillna('').rename(columns=self.injury_columns)
+        df = df[df['Status'].isin(processed.keys())]
+        
+        for status, group in df.groupby('Status', sort=False):
+            processed[status] = group[columns].to_dict('list')
                 
         return processed
 
     def process_player_stats(self, raw_data: List[Dict], stat_type: str) -> Dict[str, Dict]:
         """Process player statistics for passing, rushing, or receiving"""
-        processed = {}
-        for player in raw_data:
-            if pd.isna(player.get(f'{stat_type} Last 4 Weeks ATT', 0)):
-                continue
-                
-            name = player.get('Name', '')
-            if name:
-                stats = {}
-                for metric in self.stat_mappings.get(stat_type, []):
-                    stat_key = f'{stat_type} Last 4 Weeks {metric}'
-                    stats[metric] = player.get(stat_key, 0)
-                    
-                processed[name] = {
-                    'position': player.get('Position', ''),
-                    'stats': stats
-                }
-                
-        return processed
+        metrics = self.stat_mappings.get(stat_type, [])
+        att_col = self._att_keys.get(stat_type) or f'{stat_type} Last 4 Weeks ATT'
+        stat_cols = self._stat_keys.get(stat_type, [])
+        
+        # Defaults apply only to keys a row lacks; a value that is present but
+        # NaN/None is kept as-is (and a NaN attempt count still skips the player)
+        defaults = {'Name': '', 'Position': '', att_col: 0, **dict.fromkeys(stat_cols, 0)}
+        
+        # object dtype keeps the API's own int/str values instead of upcasting
+        df = pd.DataFrame([{**defaults, **player} for player in raw_data],
+                          columns=list(defaults), dtype=object)
+        df = df[df[att_col].notna() & df['Name'].fillna('').astype(bool)]
+        
+        if metrics:
+            stats = df[stat_cols].rename(
+                columns=dict(zip(stat_cols, metrics))
+            ).to_dict('records')
+        else:
+            stats = [{} for _ in range(len(df))]
+        
+        return {
+            name: {'position': position, 'stats': player_stats}
+            for name, position, player_stats in zip(df['Name'], df['Position'], stats)
+        }
 
     def process_team_defense(self, raw_data: List[Dict]) -> Dict:
         """Process team defense statistics"""
         if not raw_data:
             return {}
             
-        defense = raw_data[0]
-        return {
-            'points_against': defense.get('Points_Against', 0),
-            'total_yards': defense.get('Total_Yards', 0),
-            'passing_yards': defense.get('Passing_Yards', 0),
-            'rushing_yards': defense.get('Rushing_Yards', 0),
-            'turnovers': defense.get('Tot_Yds_TO_Turnovers', 0),
-            'sacks': defense.get('Passing_Sacks', 0)
-        }
+        return self._extract_fields(raw_data[0], TEAM_DEFENSE_FIELDS)
 
     def process_pass_pressure(self, raw_data: List[Dict]) -> Dict:
         """Process pass pressure statistics"""
         if not raw_data:
             return {}
             
-        pressure = raw_data[0]
-        return {
-            'blitzes': pressure.get('Passing Bltz', 0),
-            'hits': pressure.get('Passing Hits', 0),
-            'hurries': pressure.get('Passing Hrry', 0),
-            'pressure_pct': pressure.get('Passing Prss%', '0%'),
-            'pocket_time': pressure.get('Passing PktTime', 0)
-        }
+        return self._extract_fields(raw_data[0], PASS_PRESSURE_FIELDS)
 
-    def process_game_logs(self, raw_data: List[Dict]) -> List[Dict]:
-        """Process game logs into analyzable format"""
-        processed = []
-        for game in raw_data:
-            processed.append({
-                'date': game.get('Date', ''),
-                'opponent': game.get('Opp', ''),
-                'location': game.get('Location', ''),
-                'score': {
-                    'team': game.get('Score_Tm', 0),
-                    'opponent': game.get('Score_Opp', 0)
-                },
-                'stats': {
-                    'passing_yards': game.get('Passing_Yds', 0),
-                    'rushing_yards': game.get('Rushing_Yds', 0),
-                    'third_down': {
-                        'attempts': game.get('Downs_3DAtt', 0),
-                        'conversions': game.get('Downs_3DConv', 0)
-                    },
-                    'time_of_possession': game.get('ToP', '00:00')
-                }
-            })
-        return processed
+    def process_game_logs(self, raw_data: List[Dict]) -> pd.DataFrame:
+        """Process game logs into a flat, analyzable DataFrame"""
+        df = pd.DataFrame(raw_data).reindex(columns=list(self.game_log_columns))
+        df = df.rename(columns=self.game_log_columns)
+        
+        # Smallest dtypes that hold the values: counts fit in int8/int16,
+        # anything fractional falls back to float32
+        numeric = ['score_team', 'score_opp', 'passing_yards', 'rushing_yards',
+                   'third_down_att', 'third_down_conv']
+        for col in numeric:
+            values = pd.to_numeric(df[col], errors='coerce').fillna(0)
+            values = pd.to_numeric(values, downcast='integer')
+            if values.dtype.kind == 'f':
+                values = pd.to_numeric(values, downcast='float')
+            df[col] = values
+            
+        df[['date', 'opponent', 'location']] = df[['date', 'opponent', 'location']].fillna('')
+        df['top'] = df['top'].fillna('00:00')
+        df['opponent'] = df['opponent'].astype('category')
+        df['location'] = df['location'].astype('category')
+        return df
 
     def process_team_stats(self, raw_data: List[Dict]) -> Dict:
         """Process team statistics"""
-        processed = {}
-        for stat in raw_data:
-            scenario = stat.get('Stat Scenario', '')
-            if scenario:
-                processed[scenario] = {
-                    'current': stat.get('2024', '0'),
-                    'previous': stat.get('2023', '0'),
-                    'home': stat.get('Home', '0'),
-                    'away': stat.get('Away', '0'),
-                    'last_game': stat.get('Last 1', '0'),
-                    'last_three': stat.get('Last 3', '0'),
-                    'rank': stat.get('Rank', 0)
-                }
-        return processed
+        if not raw_data:
+            return {}
+        
+        df = pd.DataFrame(raw_data, dtype=object).reindex(
+            columns=['Stat Scenario', *(key for _, key, _ in TEAM_STAT_FIELDS)]
+        ).fillna({key: default for _, key, default in TEAM_STAT_FIELDS})
+        
+        # Later rows win for a repeated scenario, as with plain dict assignment
+        df = df[df['Stat Scenario'].fillna('').astype(bool)]
+        df = df.groupby('Stat Scenario', sort=False).last()
+        return df.rename(
+            columns={key: out for out, key, _ in TEAM_STAT_FIELDS}
+        ).to_dict('index')
+
+    @staticmethod
+    def _extract_fields(row: Dict, fields: tuple) -> Dict:
+        """Pull a fixed schema of (output key, API key, default) fields out of one row"""
+        get = row.get
+        return {out: get(key, default) for out, key, default in fields}
 
     def clean_numeric(self, value: Any) -> float:
         """Clean numeric values from API responses"""
-        if pd.isna(value):
+        # Plain Python scalars first; NaN is the only float unequal to itself
+        if value is None:
             return 0.0
+        if isinstance(value, float):
+            return value if value == value else 0.0
+        if isinstance(value, int):
+            return float(value)
         if isinstance(value, str):
             try:
-                return float(value.strip('%')) if '%' in value else float(value)
+                return float(value.strip('%'))
             except ValueError:
                 return 0.0
+        if pd.isna(value):
+            return 0.0
         return float(value) if value else 0.0
 
     def calculate_efficiency_metrics(self, stats: Dict) -> Dict:
@@ -178,4 +236,4 @@ class NFLDataProcessor:
         if rush_att > 0:
             metrics['yards_per_carry'] = self.clean_numeric(stats.get('Rushing_YDS', 0)) / rush_att
             
-        return metrics
\ No newline at end of file
+        return metrics
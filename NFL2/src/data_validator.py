@@ -4,6 +4,17 @@ NFL Data Validator module for ensuring data quality and completeness
 from typing import Dict, List, Any, Optional
 import pandas as pd
 
+VALID_INJURY_STATUSES = frozenset({'OUT', 'QUESTIONABLE', 'DOUBTFUL', 'IR'})
+# Key stat columns every player entry must carry, per stat type
+STAT_TYPE_REQUIRED_FIELDS = {
+    'Passing': frozenset({'ATT', 'CMP'}),
+    'Rushing': frozenset({'ATT', 'YDS'}),
+    'Receiving': frozenset({'REC', 'YDS'})
+}
+VALID_STAT_TYPES = frozenset(STAT_TYPE_REQUIRED_FIELDS)
+GAME_LOG_REQUIRED_FIELDS = frozenset({'Date', 'Opp', 'Score_Tm', 'Score_Opp', 'Location'})
+TEAM_STAT_NUMERIC_FIELDS = ('2024', '2023', 'Last 1', 'Last 3', 'Rank')
+
 class NFLDataValidator:
     def __init__(self):
         self.required_fields = {
@@ -15,6 +26,8 @@ class NFLDataValidator:
             'team_pressure': ['Team', 'Passing Bltz', 'Passing Prss%'],
             'game_logs': ['Date', 'Team', 'Opp', 'Score_Tm', 'Score_Opp']
         }
+        # Frozen once so each row check is a single subset test
+        self.required_fields = {k: frozenset(v) for k, v in self.required_fields.items()}
         
         self.expected_ranges = {
             'temperature': (-20, 120),  # Fahrenheit
@@ -36,19 +49,19 @@ class NFLDataValidator:
         if isinstance(data, list) and not data:
             return False, "Empty data list received"
             
-        required = self.required_fields.get(data_type, [])
+        required = self.required_fields.get(data_type, frozenset())
         if not self._check_required_fields(data, required):
             return False, f"Missing required fields for {data_type}"
             
         return True, "Data validation successful"
 
-    def _check_required_fields(self, data: Any, required: List[str]) -> bool:
+    def _check_required_fields(self, data: Any, required: frozenset) -> bool:
         """Check if all required fields are present"""
         if isinstance(data, list):
             return all(self._check_required_fields(item, required) for item in data)
             
         if isinstance(data, dict):
-            return all(field in data for field in required)
+            return required <= data.keys()
             
         return False
 
@@ -119,6 +132,33 @@ class NFLDataValidator:
 
         return len(errors) == 0, errors
 
+    def validate_weather_rows(self, data: List[Dict]) -> tuple[bool, List[str]]:
+        """Validate a full weather payload (one row per game) in a single pass"""
+        if not isinstance(data, list):
+            return False, ["Weather data must be a list"]
+            
+        df, errors = self._rows_frame(data, "weather data",
+                                      ['Temperature', 'Wind Speed', 'Precipitation Chance'])
+        
+        # Same rules as validate_weather_data, applied column-wise
+        temp_is_str = self._is_text(df['Temperature'])
+        errors += ["Invalid temperature data"] * int((~temp_is_str).sum())
+        has_degree = df['Temperature'][temp_is_str].astype(str).str.contains('°', regex=False)
+        errors += ["Temperature missing degree symbol"] * int((~has_degree).sum())
+        
+        wind = df['Wind Speed']
+        wind_is_num = wind.map(lambda v: isinstance(v, (int, float)))
+        errors += ["Invalid wind speed data"] * int((~wind_is_num).sum())
+        wind_ok = wind[wind_is_num].astype(float).between(0, 100)
+        errors += ["Wind speed out of reasonable range"] * int((~wind_ok).sum())
+        
+        precip_is_str = self._is_text(df['Precipitation Chance'])
+        errors += ["Invalid precipitation data"] * int((~precip_is_str).sum())
+        has_pct = df['Precipitation Chance'][precip_is_str].astype(str).str.contains('%', regex=False)
+        errors += ["Precipitation missing percentage symbol"] * int((~has_pct).sum())
+
+        return len(errors) == 0, errors
+
     def validate_injury_data(self, data: List[Dict]) -> tuple[bool, List[str]]:
         """Validate injury report data structure and content"""
         errors = []
@@ -126,14 +166,12 @@ class NFLDataValidator:
         if not isinstance(data, list):
             return False, ["Injury data must be a list"]
             
-        valid_statuses = {'OUT', 'QUESTIONABLE', 'DOUBTFUL', 'IR'}
-        
         for entry in data:
             if not isinstance(entry, dict):
                 errors.append("Invalid entry format in injury report")
                 continue
                 
-            if 'Status' not in entry or entry['Status'] not in valid_statuses:
+            if entry.get('Status') not in VALID_INJURY_STATUSES:
                 errors.append(f"Invalid status for player {entry.get('Name', 'Unknown')}")
                 
             if not entry.get('Updated'):
@@ -151,9 +189,10 @@ class NFLDataValidator:
         if not isinstance(data, list):
             return False, ["Player stats data must be a list"]
             
-        valid_stat_types = {'Passing', 'Rushing', 'Receiving'}
-        if stat_type not in valid_stat_types:
+        if stat_type not in VALID_STAT_TYPES:
             return False, [f"Invalid stat type: {stat_type}"]
+        required = STAT_TYPE_REQUIRED_FIELDS[stat_type]
+        label = stat_type.lower()
             
         for entry in data:
             if not isinstance(entry, dict):
@@ -165,15 +204,8 @@ class NFLDataValidator:
                 continue
                 
             # Validate specific stat type metrics
-            if stat_type == 'Passing':
-                if 'ATT' not in entry or 'CMP' not in entry:
-                    errors.append(f"Missing key passing stats for {entry.get('Name', 'Unknown')}")
-            elif stat_type == 'Rushing':
-                if 'ATT' not in entry or 'YDS' not in entry:
-                    errors.append(f"Missing key rushing stats for {entry.get('Name', 'Unknown')}")
-            elif stat_type == 'Receiving':
-                if 'REC' not in entry or 'YDS' not in entry:
-                    errors.append(f"Missing key receiving stats for {entry.get('Name', 'Unknown')}")
+            if not required <= entry.keys():
+                errors.append(f"Missing key {label} stats for {entry['Name']}")
 
         return len(errors) == 0, errors
 
@@ -184,16 +216,14 @@ class NFLDataValidator:
         if not isinstance(data, list):
             return False, ["Game logs data must be a list"]
             
-        required_fields = {'Date', 'Opp', 'Score_Tm', 'Score_Opp', 'Location'}
-        
         for entry in data:
             if not isinstance(entry, dict):
                 errors.append("Invalid entry format in game logs")
                 continue
                 
-            missing_fields = required_fields - set(entry.keys())
+            missing_fields = GAME_LOG_REQUIRED_FIELDS - entry.keys()
             if missing_fields:
-                errors.append(f"Missing required fields in game log: {missing_fields}")
+                errors.append(f"Missing required fields in game log: {set(missing_fields)}")
                 
             # Validate scores are numeric
             try:
@@ -220,12 +250,27 @@ class NFLDataValidator:
                 errors.append("Missing Stat Scenario in team stats")
                 
             # Validate numeric fields
-            numeric_fields = ['2024', '2023', 'Last 1', 'Last 3', 'Rank']
-            for field in numeric_fields:
+            for field in TEAM_STAT_NUMERIC_FIELDS:
                 if field in entry:
                     try:
                         float(entry[field])
                     except (ValueError, TypeError):
                         errors.append(f"Invalid numeric value for {field} in team stats")
 
-        return len(errors) == 0, errors
\ No newline at end of file
+        return len(errors) == 0, errors
+
+    def _rows_frame(self, data: List[Any], label: str,
+                    columns: List[str]) -> tuple[pd.DataFrame, List[str]]:
+        """Build one DataFrame from the dict rows, reporting any non-dict entries"""
+        # Absent keys become None, as entry.get() would return, rather than a
+        # NaN that passes for a float
+        absent = dict.fromkeys(columns)
+        rows = [{**absent, **entry} for entry in data if isinstance(entry, dict)]
+        errors = [f"Invalid entry format in {label}"] * (len(data) - len(rows))
+        df = pd.DataFrame(rows, columns=columns, dtype=object)
+        return df, errors
+
+    @staticmethod
+    def _is_text(values: pd.Series) -> pd.Series:
+        """Entries that are non-empty strings"""
+        return values.map(lambda v: isinstance(v, str) and v != '')
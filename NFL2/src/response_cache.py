@@ -0,0 +1,72 @@
+"""
+NFL Response Cache module for persisting API responses between runs
+"""
+import asyncio
+import contextlib
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+# Sentinel meaning "use the TTL configured for the endpoint"
+_ENDPOINT_TTL = object()
+
+class NFLResponseCache:
+    def __init__(self, path: str, default_ttl: Optional[float] = None,
+                 ttls: Optional[Dict[str, Optional[float]]] = None):
+        self.path = Path(path)
+        self.default_ttl = default_ttl
+        self.ttls = ttls or {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, data TEXT NOT NULL, expires_at REAL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the cache database (callers close it)"""
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict]) -> str:
+        """Build a stable cache key from an endpoint and its parameters"""
+        raw = endpoint + json.dumps(sorted((params or {}).items()))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _read(self, key: str) -> Optional[Any]:
+        """Return a cached payload, or None if missing or expired"""
+        with contextlib.closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT data, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        data, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            return None
+        return json.loads(data)
+
+    def _write(self, key: str, data: Any, ttl: Optional[float]) -> None:
+        """Store a payload, replacing any existing entry"""
+        expires_at = time.time() + ttl if ttl is not None else None
+        with contextlib.closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, data, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(data), expires_at)
+            )
+
+    async def get(self, endpoint: str, params: Optional[Dict]) -> Optional[Any]:
+        """Look up a cached API response"""
+        return await asyncio.to_thread(self._read, self.make_key(endpoint, params))
+
+    async def set(self, endpoint: str, params: Optional[Dict], data: Any,
+                  ttl: Any = _ENDPOINT_TTL) -> None:
+        """Cache an API response; ttl overrides the endpoint's TTL (None never expires)"""
+        if ttl is _ENDPOINT_TTL:
+            ttl = self.ttls.get(endpoint, self.default_ttl)
+        await asyncio.to_thread(self._write, self.make_key(endpoint, params), data, ttl)
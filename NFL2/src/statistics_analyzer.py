@@ -1,11 +1,31 @@
 """
 NFL Statistics Analyzer module for statistical analysis and trend identification
 """
+import bisect
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 
+# (metric, weight) pairs feeding the base win probability
+BASE_PROBABILITY_FACTORS = (
+    ('points_per_game', 0.3),
+    ('yards_per_game', 0.2),
+    ('defensive_rating', 0.3),
+    ('turnover_margin', 0.2)
+)
+
+# Weather impact levels and the thresholds a value must exceed to reach each one
+IMPACT_LEVELS = ('low', 'moderate', 'high')
+WIND_IMPACT_THRESHOLDS = (10, 15)
+PRECIPITATION_IMPACT_THRESHOLDS = (30, 50)
+
+# Numeric game log columns pulled out as plain arrays for trend analysis
+TREND_COLUMNS = (
+    'score_team', 'score_opp', 'passing_yards', 'rushing_yards',
+    'third_down_att', 'third_down_conv'
+)
+
 class NFLStatisticsAnalyzer:
     def __init__(self):
         self.sample_size_threshold = 3  # Minimum games for trend analysis
@@ -26,19 +46,22 @@ class NFLStatisticsAnalyzer:
             return {}
 
         try:
-            attempts = float(stats.get('ATT', 0))
-            if attempts == 0:
-                return {}
-
-            return {
-                'completion_pct': (float(stats.get('CMP', 0)) / attempts) * 100,
-                'yards_per_attempt': float(stats.get('YDS', 0)) / attempts,
-                'touchdown_rate': (float(stats.get('TD', 0)) / attempts) * 100,
-                'interception_rate': (float(stats.get('INT', 0)) / attempts) * 100
-            }
-        except (ValueError, TypeError, ZeroDivisionError):
+            attempts, completions, yards, touchdowns, interceptions = (
+                float(stats.get(key, 0)) for key in ('ATT', 'CMP', 'YDS', 'TD', 'INT')
+            )
+        except (ValueError, TypeError):
+            return {}
+        if attempts <= 0:
             return {}
 
+        pct = 100 / attempts
+        return {
+            'completion_pct': completions * pct,
+            'yards_per_attempt': yards / attempts,
+            'touchdown_rate': touchdowns * pct,
+            'interception_rate': interceptions * pct
+        }
+
     def analyze_rushing_attack(self, stats: Dict) -> Dict:
         """Analyze rushing attack effectiveness"""
         analysis = {
@@ -57,66 +80,120 @@ class NFLStatisticsAnalyzer:
         }
         return analysis
 
-    def analyze_game_trends(self, game_logs: List[Dict]) -> Dict:
-        """Analyze team performance trends from game logs"""
+    def analyze_game_trends(self, game_logs: pd.DataFrame) -> Dict:
+        """Analyze team performance trends from processed game logs"""
         if len(game_logs) < self.sample_size_threshold:
             return {'error': 'Insufficient game data for trend analysis'}
 
-        df = pd.DataFrame(game_logs)
+        cols = self._to_columns(game_logs)
         
         trends = {
-            'scoring': self._analyze_scoring_trends(df),
-            'yardage': self._analyze_yardage_trends(df),
-            'efficiency': self._analyze_efficiency_trends(df),
-            'situational': self._analyze_situational_trends(df)
+            'scoring': self._analyze_scoring_trends(cols),
+            'yardage': self._analyze_yardage_trends(cols),
+            'efficiency': self._analyze_efficiency_trends(cols),
+            'situational': self._analyze_situational_trends(cols)
         }
         return trends
 
-    def _analyze_scoring_trends(self, df: pd.DataFrame) -> Dict:
+    @staticmethod
+    def _to_columns(game_logs: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Pull the numeric game log columns out once as float64 arrays"""
+        return {
+            col: game_logs[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            for col in TREND_COLUMNS if col in game_logs
+        }
+
+    def _analyze_scoring_trends(self, cols: Dict[str, np.ndarray]) -> Dict:
         """Analyze scoring patterns and trends"""
-        try:
-            recent_scores = df['score.team'].tail(3).tolist()
-            avg_score = df['score.team'].mean()
-            score_trend = self._calculate_trend(recent_scores)
-            
-            return {
-                'recent_scores': recent_scores,
-                'average_score': round(avg_score, 2),
-                'trend': score_trend,
-                'consistency': self._calculate_consistency(df['score.team'])
-            }
-        except Exception:
+        scores = cols.get('score_team')
+        if scores is None or scores.size == 0:
             return {}
+        recent_scores = scores[-3:].tolist()
+        
+        return {
+            'recent_scores': recent_scores,
+            'average_score': round(float(scores.mean()), 2),
+            'trend': self._calculate_trend(recent_scores),
+            'consistency': self._calculate_consistency(scores)
+        }
 
-    def _analyze_yardage_trends(self, df: pd.DataFrame) -> Dict:
+    def _analyze_yardage_trends(self, cols: Dict[str, np.ndarray]) -> Dict:
         """Analyze yardage production trends"""
-        try:
-            passing_yards = df['stats.passing_yards'].tolist()
-            rushing_yards = df['stats.rushing_yards'].tolist()
-            
-            return {
-                'passing': {
-                    'trend': self._calculate_trend(passing_yards),
-                    'average': round(np.mean(passing_yards), 2),
-                    'consistency': self._calculate_consistency(passing_yards)
-                },
-                'rushing': {
-                    'trend': self._calculate_trend(rushing_yards),
-                    'average': round(np.mean(rushing_yards), 2),
-                    'consistency': self._calculate_consistency(rushing_yards)
-                }
+        if not {'passing_yards', 'rushing_yards'} <= cols.keys() or cols['passing_yards'].size == 0:
+            return {}
+        
+        # One pass over both columns: means, spreads and endpoint slopes together
+        yards = np.column_stack((cols['passing_yards'], cols['rushing_yards']))
+        means = yards.mean(axis=0)
+        stds = yards.std(axis=0)
+        slopes = (yards[-1] - yards[0]) / (len(yards) - 1) if len(yards) >= 2 else None
+        
+        result = {}
+        for i, name in enumerate(('passing', 'rushing')):
+            if slopes is None:
+                trend = consistency = 'insufficient_data'
+            else:
+                trend = self._classify_trend(slopes[i])
+                consistency = self._classify_consistency(
+                    stds[i] / means[i] if means[i] != 0 else float('inf')
+                )
+            result[name] = {
+                'trend': trend,
+                'average': round(float(means[i]), 2),
+                'consistency': consistency
             }
-        except Exception:
+        return result
+
+    def _analyze_efficiency_trends(self, cols: Dict[str, np.ndarray]) -> Dict:
+        """Analyze third down conversion efficiency"""
+        if not {'third_down_att', 'third_down_conv'} <= cols.keys():
+            return {}
+        
+        attempts = np.nan_to_num(cols['third_down_att'])
+        conversions = np.nan_to_num(cols['third_down_conv'])
+        total_attempts = attempts.sum()
+        if total_attempts <= 0:
             return {}
+        
+        played = attempts > 0
+        rates = conversions[played] / attempts[played] * 100
+        return {
+            'third_down_pct': round(float(conversions.sum() / total_attempts * 100), 2),
+            'trend': self._calculate_trend(rates[-3:]),
+            'consistency': self._calculate_consistency(rates)
+        }
+
+    def _analyze_situational_trends(self, cols: Dict[str, np.ndarray]) -> Dict:
+        """Analyze results and margins of victory"""
+        if not {'score_team', 'score_opp'} <= cols.keys():
+            return {}
+        
+        margins = cols['score_team'] - cols['score_opp']
+        margins = margins[~np.isnan(margins)]
+        if margins.size == 0:
+            return {}
+        
+        return {
+            'record': {
+                'wins': int((margins > 0).sum()),
+                'losses': int((margins < 0).sum()),
+                'ties': int((margins == 0).sum())
+            },
+            'average_margin': round(float(margins.mean()), 2),
+            'one_score_games': int((np.abs(margins) <= 8).sum())
+        }
 
     def _calculate_trend(self, values: List[float]) -> str:
         """Calculate trend direction from recent values"""
-        if len(values) < 2:
+        values = np.asarray(values, dtype=np.float64)
+        if values.size < 2:
             return 'insufficient_data'
             
-        diffs = [values[i] - values[i-1] for i in range(1, len(values))]
-        avg_diff = np.mean(diffs)
-        
+        # Mean of consecutive differences telescopes to (last - first) / steps
+        return self._classify_trend((values[-1] - values[0]) / (values.size - 1))
+
+    def _classify_trend(self, avg_diff: float) -> str:
+        """Map an average per-game change onto a trend label"""
         if avg_diff > 5:
             return 'strongly_increasing'
         elif avg_diff > 0:
@@ -130,11 +207,15 @@ class NFLStatisticsAnalyzer:
 
     def _calculate_consistency(self, values: List[float]) -> str:
         """Calculate consistency rating based on variance"""
-        if len(values) < 2:
+        values = np.asarray(values, dtype=np.float64)
+        if values.size < 2:
             return 'insufficient_data'
             
-        cv = np.std(values) / np.mean(values) if np.mean(values) != 0 else float('inf')
-        
+        mean = values.mean()
+        return self._classify_consistency(values.std() / mean if mean != 0 else float('inf'))
+
+    def _classify_consistency(self, cv: float) -> str:
+        """Map a coefficient of variation onto a consistency label"""
         if cv < 0.1:
             return 'very_consistent'
         elif cv < 0.2:
@@ -169,11 +250,16 @@ class NFLStatisticsAnalyzer:
         precipitation = float(weather.get('precipitation', '0').strip('%'))
         
         impact = {
-            'wind_impact': 'high' if wind_speed > 15 else 'moderate' if wind_speed > 10 else 'low',
-            'precipitation_impact': 'high' if precipitation > 50 else 'moderate' if precipitation > 30 else 'low'
+            'wind_impact': self._impact_level(wind_speed, WIND_IMPACT_THRESHOLDS),
+            'precipitation_impact': self._impact_level(precipitation, PRECIPITATION_IMPACT_THRESHOLDS)
         }
         return impact
 
+    @staticmethod
+    def _impact_level(value: float, thresholds: tuple) -> str:
+        """Look up the impact level for a value (thresholds are exclusive)"""
+        return IMPACT_LEVELS[bisect.bisect_left(thresholds, value)]
+
     def calculate_win_probability(self, team_stats: Dict, opponent_stats: Dict, 
                                 conditions: Dict) -> float:
         """Calculate win probability based on comprehensive analysis"""
@@ -196,20 +282,14 @@ class NFLStatisticsAnalyzer:
     def _calculate_base_probability(self, team: Dict, opponent: Dict) -> float:
         """Calculate base win probability from team statistics"""
         try:
-            team_score = (
-                float(team.get('points_per_game', 0)) * 0.3 +
-                float(team.get('yards_per_game', 0)) * 0.2 +
-                float(team.get('defensive_rating', 0)) * 0.3 +
-                float(team.get('turnover_margin', 0)) * 0.2
+            team_score = sum(
+                float(team.get(metric, 0)) * weight for metric, weight in BASE_PROBABILITY_FACTORS
             )
-            
-            opp_score = (
-                float(opponent.get('points_per_game', 0)) * 0.3 +
-                float(opponent.get('yards_per_game', 0)) * 0.2 +
-                float(opponent.get('defensive_rating', 0)) * 0.3 +
-                float(opponent.get('turnover_margin', 0)) * 0.2
+            opp_score = sum(
+                float(opponent.get(metric, 0)) * weight for metric, weight in BASE_PROBABILITY_FACTORS
             )
-            
-            return team_score / (team_score + opp_score)
-        except Exception:
-            return 0.5
\ No newline at end of file
+        except (ValueError, TypeError):
+            return 0.5
+        
+        total = team_score + opp_score
+        return team_score / total if total != 0 else 0.5
@@ -1,14 +1,91 @@
 import asyncio
+import hashlib
 import json
 import os
-from typing import Dict, List, Optional, Tuple, Callable
+import re
+import string
+import time
+from typing import Any, Dict, List, Optional, Tuple, Callable
 from datetime import datetime
 from pathlib import Path
-import requests
-from .api_client import NFLApiClient
+import aiohttp
+import orjson
+from .api_client import NFLApiClient, extract_teams
 from .data_processor import NFLDataProcessor, GameContext
 from .odds_fetcher import NFLOddsFetcher
 
+# Default for analyze_game's odds argument: fetch them for this game alone
+_FETCH_ODDS = object()
+
+# Concurrent LLM requests when OLLAMA_NUM_PARALLEL isn't set; kept low because
+# extra requests just wait in the server's queue
+DEFAULT_LLM_CONCURRENCY = 4
+
+# (progress message sent when it finishes, result key, analysis method, extra args)
+# for each independent analysis
+ANALYSIS_STEPS = (
+    ("Analyzed depth charts", "depth_charts", "_analyze_depth_charts", ()),
+    ("Analyzed weather and injuries", "weather_and_injuries", "_analyze_weather_injuries", ()),
+    ("Analyzed home team 4-week performance", "home_team_4-week_performance",
+     "_analyze_team_performance", ('home', 'Last 4 Weeks')),
+    ("Analyzed home team 2-week performance", "home_team_2-week_performance",
+     "_analyze_team_performance", ('home', 'Last 2 Weeks')),
+    ("Analyzed away team 4-week performance", "away_team_4-week_performance",
+     "_analyze_team_performance", ('away', 'Last 4 Weeks')),
+    ("Analyzed away team 2-week performance", "away_team_2-week_performance",
+     "_analyze_team_performance", ('away', 'Last 2 Weeks')),
+    ("Analyzed home team defense", "home_team_defense", "_analyze_team_defense", ('home',)),
+    ("Analyzed away team defense", "away_team_defense", "_analyze_team_defense", ('away',)),
+    ("Analyzed team defense comparison", "team_defense_comparison", "_analyze_defense_comparison", ()),
+    ("Analyzed pass rush", "pass_rush", "_analyze_pass_rush", ()),
+    ("Analyzed team stats", "team_stats", "_analyze_team_stats", ()),
+    ("Analyzed pass protection", "pass_protection", "_analyze_pass_protection", ()),
+    ("Analyzed game logs", "game_logs", "_analyze_game_logs", ())
+)
+
+def _to_json(obj) -> str:
+    """Compact JSON for embedding in a prompt; indentation only costs the model tokens"""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+def _compile_template(template: str) -> Callable[[Dict[str, str]], str]:
+    """Parse a prompt template once into a renderer for its plain {field} placeholders"""
+    parts = [(literal, field) for literal, field, _, _ in string.Formatter().parse(template)]
+
+    def render(values: Dict[str, str]) -> str:
+        return "".join(
+            literal if field is None else literal + str(values[field]) for literal, field in parts
+        )
+    return render
+
+def _slug(name: str) -> str:
+    """Make a team name safe to use in a filename"""
+    return re.sub(r"[^A-Za-z0-9]+", "_", name).strip("_")
+
+def _llm_concurrency() -> int:
+    """Concurrent LLM requests to allow, from OLLAMA_NUM_PARALLEL if it is a valid count"""
+    value = os.environ.get("OLLAMA_NUM_PARALLEL", "")
+    try:
+        return max(1, int(value))
+    except ValueError:
+        if value:
+            print(f"Warning: ignoring invalid OLLAMA_NUM_PARALLEL={value!r}")
+        return DEFAULT_LLM_CONCURRENCY
+
+class _JsonFragments(dict):
+    """Per-game cache of prompt JSON fragments, keyed by path into the processed data"""
+    
+    def __init__(self, data: Dict):
+        super().__init__()
+        self.data = data
+
+    def __missing__(self, path) -> str:
+        """Serialize a payload the first time any prompt asks for it"""
+        value = self.data
+        for key in (path,) if isinstance(path, str) else path:
+            value = value[key]
+        fragment = self[path] = _to_json(value)
+        return fragment
+
 class NFLAnalyzer:
     """Enhanced NFL game analyzer with complete prompt handling"""
     
@@ -24,98 +101,219 @@ class NFLAnalyzer:
             "top_p": 0.9,
             "stop": ["</analysis>"]
         }
+        # Streamed generations can legitimately run long (and wait in Ollama's queue),
+        # so bound inactivity between chunks rather than the whole request
+        self.llm_timeout = aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=30)
+        # Match the server's OLLAMA_NUM_PARALLEL (when exported here too) so every slot
+        # stays busy without queueing
+        self.max_concurrent_llm_requests = _llm_concurrency()
+        self.llm_semaphore = asyncio.Semaphore(self.max_concurrent_llm_requests)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.max_concurrent_games = 3
+        self.game_semaphore = asyncio.Semaphore(self.max_concurrent_games)
+        
+        # On-disk cache of LLM responses, keyed by a hash of the full request
+        self.llm_cache_dir = Path('cache/llm')
+        self.llm_cache_dir.mkdir(parents=True, exist_ok=True)
+        self.llm_cache_ttl = 24 * 60 * 60
         
         # Load prompts from data directory
         try:
             prompt_path = Path('data/nfl_prompts.json')
             with open(prompt_path, 'r') as f:
                 self.prompt_templates = json.load(f)
+            self._compiled = {
+                name: _compile_template(template) for name, template in self.prompt_templates.items()
+            }
             print("✓ Loaded prompt templates")
         except Exception as e:
             print(f"❌ Error loading prompts from {prompt_path}: {str(e)}")
             raise
 
-    async def get_llm_response(self, prompt: str, context: GameContext) -> str:
-        """Get analysis from local LLM with enhanced context"""
-        system_context = (
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrent_llm_requests)
+            )
+        return self._session
+
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _llm_cache_path(self, system_context: str, prompt: str) -> Path:
+        """Cache file for one exact model/parameters/system/prompt combination"""
+        key = hashlib.blake2b(
+            f"{self.model}|{_to_json(self.model_params)}|{system_context}|{prompt}".encode(),
+            digest_size=16
+        ).hexdigest()
+        return self.llm_cache_dir / f"{key}.txt"
+
+    def _read_llm_cache(self, path: Path) -> Optional[str]:
+        """Return a cached response if present and still fresh"""
+        try:
+            if time.time() - path.stat().st_mtime < self.llm_cache_ttl:
+                return path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            pass
+        return None
+
+    async def _read_llm_stream(self, response: aiohttp.ClientResponse,
+                               on_token: Optional[Callable[[str], None]]) -> str:
+        """Collect a streamed generation, stopping as soon as a stop marker appears"""
+        stops = self.model_params.get("stop", [])
+        longest_stop = max(map(len, stops), default=0)
+        pieces = []
+        tail = ""
+        finished = False
+        
+        async for line in response.content:
+            if not line.strip():
+                continue
+            chunk = orjson.loads(line)
+            # Ollama reports failures mid-stream (e.g. a runner crash) after a 200
+            if "error" in chunk:
+                raise Exception(f"Ollama error: {chunk['error']}")
+            token = chunk.get("response", "")
+            if token:
+                pieces.append(token)
+                if on_token:
+                    on_token(token)
+            if chunk.get("done"):
+                finished = True
+                break
+            
+            # Only the newest characters can complete a marker
+            tail = (tail + token)[-(longest_stop + len(token)):]
+            if any(stop in tail for stop in stops):
+                finished = True
+                break
+        
+        if not finished:
+            raise Exception("Ollama stream ended before the generation finished")
+        
+        analysis = "".join(pieces)
+        for stop in stops:
+            analysis = analysis.split(stop, 1)[0]
+        return analysis
+
+    @staticmethod
+    def _build_system_context(context: GameContext) -> str:
+        """System prompt shared by every analysis of a game"""
+        return (
             f"You are analyzing NFL game: {context.home_team} vs {context.away_team}\n"
             f"Venue: {context.venue}\nDate: {context.date}\n"
             "Provide specific, data-driven analysis based only on the statistics provided.\n"
             "Focus on clear, actionable insights supported by the data.\n"
             "When discussing betting implications, provide specific reasoning based on the data."
         )
+
+    async def get_llm_response(self, prompt: str, context: GameContext,
+                               on_token: Optional[Callable[[str], None]] = None) -> str:
+        """Get analysis from local LLM with enhanced context"""
+        system_context = context.system_context or self._build_system_context(context)
+        
+        cache_path = self._llm_cache_path(system_context, prompt)
+        cached = await asyncio.to_thread(self._read_llm_cache, cache_path)
+        if cached is not None:
+            return cached
         
         try:
-            response = requests.post(
-                self.ollama_url,
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "system": system_context,
-                    "stream": False,
-                    **self.model_params
-                },
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()['response']
+            session = await self._get_session()
+            # Bounded so concurrent analyses don't overwhelm the model server
+            async with self.llm_semaphore:
+                async with session.post(
+                    self.ollama_url,
+                    json={
+                        "model": self.model,
+                        "prompt": prompt,
+                        "system": system_context,
+                        "stream": True,
+                        **self.model_params
+                    },
+                    timeout=self.llm_timeout
+                ) as response:
+                    response.raise_for_status()
+                    analysis = await self._read_llm_stream(response, on_token)
         except Exception as e:
             print(f"Error getting LLM response: {str(e)}")
             return "Error: Unable to get analysis"
+        
+        # Only clean, non-empty generations reach here; anything else would be replayed for a day
+        if analysis.strip():
+            try:
+                await asyncio.to_thread(cache_path.write_text, analysis, encoding='utf-8')
+            except OSError as e:
+                print(f"Warning: could not cache LLM response: {str(e)}")
+        return analysis
 
-    async def analyze_game(self, game_data: Dict, progress_callback: Optional[Callable] = None) -> Dict[str, str]:
-        """Complete game analysis with all 14 prompts"""
+    async def analyze_game(self, game_data: Dict, progress_callback: Optional[Callable] = None,
+                           teams: Optional[Tuple[str, str]] = None,
+                           odds: Any = _FETCH_ODDS) -> Dict[str, str]:
+        """Complete game analysis with all 14 prompts (odds may be prefetched, None if unavailable)"""
         try:
             # Initialize game context
+            home_team, away_team = teams or extract_teams(game_data)
             game_context = GameContext(
                 game_id=game_data['id'],
-                home_team=game_data['competitions'][0]['competitors'][0]['team']['displayName'],
-                away_team=game_data['competitions'][0]['competitors'][1]['team']['displayName'],
+                home_team=home_team,
+                away_team=away_team,
                 venue=game_data['competitions'][0]['venue']['fullName'],
                 date=game_data['date']
             )
+            # Built once so all 14 requests send a byte-identical system prompt, letting
+            # Ollama reuse its cached prefix; anything prompt-specific belongs in the prompt
+            game_context.system_context = self._build_system_context(game_context)
 
             # Fetch all required data
             if progress_callback:
                 progress_callback("Fetching game data...")
-            raw_data = await self.api_client.fetch_all_game_data(game_data)
+            if odds is _FETCH_ODDS:
+                raw_data, odds = await asyncio.gather(
+                    self.api_client.fetch_all_game_data(game_data, (home_team, away_team)),
+                    self.odds_fetcher.get_odds(game_data['id'])
+                )
+            else:
+                raw_data = await self.api_client.fetch_all_game_data(game_data, (home_team, away_team))
+            raw_data["odds"] = odds
             
-            # Process all data
-            processed_data = self.data_processor.combine_analysis_data(raw_data, game_context)
+            # Process all data off the event loop so other games keep making progress
+            processed_data = await asyncio.to_thread(
+                self.data_processor.combine_analysis_data, raw_data, game_context
+            )
+            fragments = _JsonFragments(processed_data)
             analyses = {}
 
-            # Run analyses with progress tracking
-            analysis_steps = [
-                ("Analyzing depth charts...", self._analyze_depth_charts),
-                ("Analyzing weather and injuries...", self._analyze_weather_injuries),
-                ("Analyzing home team 4-week performance...", 
-                 lambda d, c: self._analyze_team_performance(d, 'home', 'Last 4 Weeks', c)),
-                ("Analyzing home team 2-week performance...", 
-                 lambda d, c: self._analyze_team_performance(d, 'home', 'Last 2 Weeks', c)),
-                ("Analyzing away team 4-week performance...", 
-                 lambda d, c: self._analyze_team_performance(d, 'away', 'Last 4 Weeks', c)),
-                ("Analyzing away team 2-week performance...", 
-                 lambda d, c: self._analyze_team_performance(d, 'away', 'Last 2 Weeks', c)),
-                ("Analyzing home team defense...", 
-                 lambda d, c: self._analyze_team_defense(d, 'home', c)),
-                ("Analyzing away team defense...", 
-                 lambda d, c: self._analyze_team_defense(d, 'away', c)),
-                ("Analyzing team defense comparison...", self._analyze_defense_comparison),
-                ("Analyzing pass rush...", self._analyze_pass_rush),
-                ("Analyzing team stats...", self._analyze_team_stats),
-                ("Analyzing pass protection...", self._analyze_pass_protection),
-                ("Analyzing game logs...", self._analyze_game_logs),
-                ("Generating final analysis...", 
-                 lambda d, c: self._generate_final_analysis(d, analyses, c))
-            ]
-
-            for step_message, analysis_func in analysis_steps:
-                if progress_callback:
-                    progress_callback(step_message)
-                    
-                key = step_message.replace("Analyzing ", "").replace("Generating ", "").replace("...", "")
-                key = key.lower().replace(" ", "_")
-                analyses[key] = await analysis_func(processed_data, game_context)
+            async def run_step(step_message: str, method_name: str, args: Tuple) -> str:
+                """Run one analysis, reporting progress once it has actually finished"""
+                try:
+                    return await getattr(self, method_name)(fragments, *args, game_context)
+                finally:
+                    if progress_callback:
+                        progress_callback(step_message)
+
+            # The individual analyses don't depend on each other, so run them together
+            results = await asyncio.gather(
+                *(run_step(step_message, method_name, args)
+                  for step_message, _, method_name, args in ANALYSIS_STEPS),
+                return_exceptions=True
+            )
+
+            for (_, key, _, _), result in zip(ANALYSIS_STEPS, results):
+                if isinstance(result, Exception):
+                    print(f"Error in {key} analysis: {str(result)}")
+                    result = f"Error: Unable to get analysis ({str(result)})"
+                analyses[key] = result
+
+            # The final analysis builds on all of the others
+            if progress_callback:
+                progress_callback("Generating final analysis...")
+            analyses["final_analysis"] = await self._generate_final_analysis(
+                fragments, analyses, game_context
+            )
 
             return analyses
             
@@ -124,30 +322,34 @@ class NFLAnalyzer:
             print(error_msg)
             return {"error": error_msg}
 
-    async def _analyze_depth_charts(self, data: Dict, context: GameContext) -> str:
+    def _render_prompt(self, name: str, context: GameContext, fields: Dict[str, str]) -> str:
+        """Fill a precompiled prompt with the game's teams and venue plus prompt-specific fields"""
+        return self._compiled[name]({
+            "home_team": context.home_team,
+            "away_team": context.away_team,
+            "venue": context.venue,
+            **fields
+        })
+
+    async def _analyze_depth_charts(self, fragments: _JsonFragments, context: GameContext) -> str:
         """Prompt 1: Depth chart analysis"""
-        prompt = self.prompt_templates["prompt_1"].format(
-            home_team=context.home_team,
-            away_team=context.away_team,
-            home_depth=json.dumps(data["depth_charts"]["home"], indent=2),
-            away_depth=json.dumps(data["depth_charts"]["away"], indent=2),
-            venue=context.venue
-        )
+        prompt = self._render_prompt("prompt_1", context, {
+            "home_depth": fragments["depth_charts", "home"],
+            "away_depth": fragments["depth_charts", "away"]
+        })
         return await self.get_llm_response(prompt, context)
 
-    async def _analyze_weather_injuries(self, data: Dict, context: GameContext) -> str:
+    async def _analyze_weather_injuries(self, fragments: _JsonFragments, context: GameContext) -> str:
         """Prompt 2: Weather and injuries analysis"""
-        prompt = self.prompt_templates["prompt_2"].format(
-            weather=json.dumps(data["game_info"]["weather"], indent=2),
-            home_team=context.home_team,
-            away_team=context.away_team,
-            home_injuries=json.dumps(data["injuries"]["home"], indent=2),
-            away_injuries=json.dumps(data["injuries"]["away"], indent=2)
-        )
+        prompt = self._render_prompt("prompt_2", context, {
+            "weather": fragments["game_info", "weather"],
+            "home_injuries": fragments["injuries", "home"],
+            "away_injuries": fragments["injuries", "away"]
+        })
         return await self.get_llm_response(prompt, context)
 
     async def _analyze_team_performance(
-        self, data: Dict, team_type: str, timeframe: str, context: GameContext
+        self, fragments: _JsonFragments, team_type: str, timeframe: str, context: GameContext
     ) -> str:
         """Prompts 3-6: Team performance analysis"""
         prompt_num = {
@@ -162,139 +364,165 @@ class NFLAnalyzer:
         # Map timeframe to data structure key
         stats_key = "2_weeks" if timeframe == "Last 2 Weeks" else "4_weeks"
         
-        prompt = self.prompt_templates[prompt_num].format(
-            team=team,
-            passing=json.dumps(data["player_stats"][team_type]["passing"][stats_key], indent=2),
-            rushing=json.dumps(data["player_stats"][team_type]["rushing"][stats_key], indent=2),
-            receiving=json.dumps(data["player_stats"][team_type]["receiving"][stats_key], indent=2)
-        )
+        prompt = self._render_prompt(prompt_num, context, {
+            "team": team,
+            "passing": fragments["player_stats", team_type, "passing", stats_key],
+            "rushing": fragments["player_stats", team_type, "rushing", stats_key],
+            "receiving": fragments["player_stats", team_type, "receiving", stats_key]
+        })
         return await self.get_llm_response(prompt, context)
 
     async def _analyze_team_defense(
-        self, data: Dict, team_type: str, context: GameContext
+        self, fragments: _JsonFragments, team_type: str, context: GameContext
     ) -> str:
         """Prompts 7-8: Team defense analysis"""
         prompt_num = "prompt_7" if team_type == 'home' else "prompt_8"
         team = context.home_team if team_type == 'home' else context.away_team
         
-        prompt = self.prompt_templates[prompt_num].format(
-            team=team,
-            defense_2wk=json.dumps(data["player_stats"][team_type]["defense"]["2_weeks"], indent=2),
-            defense_4wk=json.dumps(data["player_stats"][team_type]["defense"]["4_weeks"], indent=2)
-        )
+        prompt = self._render_prompt(prompt_num, context, {
+            "team": team,
+            "defense_2wk": fragments["player_stats", team_type, "defense", "2_weeks"],
+            "defense_4wk": fragments["player_stats", team_type, "defense", "4_weeks"]
+        })
         return await self.get_llm_response(prompt, context)
 
-    async def _analyze_defense_comparison(self, data: Dict, context: GameContext) -> str:
+    async def _analyze_defense_comparison(self, fragments: _JsonFragments, context: GameContext) -> str:
         """Prompt 9: Defense comparison"""
-        prompt = self.prompt_templates["prompt_9"].format(
-            home_team=context.home_team,
-            away_team=context.away_team,
-            home_defense=json.dumps(data["defense"]["home"], indent=2),
-            away_defense=json.dumps(data["defense"]["away"], indent=2)
-        )
+        prompt = self._render_prompt("prompt_9", context, {
+            "home_defense": fragments["defense", "home"],
+            "away_defense": fragments["defense", "away"]
+        })
         return await self.get_llm_response(prompt, context)
 
-    async def _analyze_pass_rush(self, data: Dict, context: GameContext) -> str:
+    async def _analyze_pass_rush(self, fragments: _JsonFragments, context: GameContext) -> str:
         """Prompt 10: Pass rush analysis"""
-        prompt = self.prompt_templates["prompt_10"].format(
-            home_team=context.home_team,
-            away_team=context.away_team,
-            home_pressure=json.dumps(data["pressure"]["home"], indent=2),
-            away_pressure=json.dumps(data["pressure"]["away"], indent=2)
-        )
+        prompt = self._render_prompt("prompt_10", context, {
+            "home_pressure": fragments["pressure", "home"],
+            "away_pressure": fragments["pressure", "away"]
+        })
         return await self.get_llm_response(prompt, context)
 
-    async def _analyze_team_stats(self, data: Dict, context: GameContext) -> str:
+    async def _analyze_team_stats(self, fragments: _JsonFragments, context: GameContext) -> str:
         """Prompt 11: Team stats analysis"""
-        prompt = self.prompt_templates["prompt_11"].format(
-            home_team=context.home_team,
-            away_team=context.away_team,
-            home_stats=json.dumps(data["team_stats"]["home"], indent=2),
-            away_stats=json.dumps(data["team_stats"]["away"], indent=2)
-        )
+        prompt = self._render_prompt("prompt_11", context, {
+            "home_stats": fragments["team_stats", "home"],
+            "away_stats": fragments["team_stats", "away"]
+        })
         return await self.get_llm_response(prompt, context)
 
-    async def _analyze_pass_protection(self, data: Dict, context: GameContext) -> str:
+    async def _analyze_pass_protection(self, fragments: _JsonFragments, context: GameContext) -> str:
         """Prompt 12: Pass protection analysis"""
-        prompt = self.prompt_templates["prompt_12"].format(
-            home_team=context.home_team,
-            away_team=context.away_team,
-            home_protection=json.dumps(data["pressure"]["home"], indent=2),  # Using pressure data
-            away_protection=json.dumps(data["pressure"]["away"], indent=2)   # Using pressure data
-        )
+        prompt = self._render_prompt("prompt_12", context, {
+            "home_protection": fragments["pressure", "home"],  # Using pressure data
+            "away_protection": fragments["pressure", "away"]  # Using pressure data
+        })
         return await self.get_llm_response(prompt, context)
 
-    async def _analyze_game_logs(self, data: Dict, context: GameContext) -> str:
+    async def _analyze_game_logs(self, fragments: _JsonFragments, context: GameContext) -> str:
         """Prompt 13: Game logs analysis"""
-        prompt = self.prompt_templates["prompt_13"].format(
-            home_team=context.home_team,
-            away_team=context.away_team,
-            home_logs=json.dumps(data["game_logs"]["home"], indent=2),
-            away_logs=json.dumps(data["game_logs"]["away"], indent=2),
-            home_opp=json.dumps(data["opponent_logs"]["home"], indent=2),
-            away_opp=json.dumps(data["opponent_logs"]["away"], indent=2)
-        )
+        prompt = self._render_prompt("prompt_13", context, {
+            "home_logs": fragments["game_logs", "home"],
+            "away_logs": fragments["game_logs", "away"],
+            "home_opp": fragments["opponent_logs", "home"],
+            "away_opp": fragments["opponent_logs", "away"]
+        })
         return await self.get_llm_response(prompt, context)
 
     async def _generate_final_analysis(
-        self, data: Dict, analyses: Dict[str, str], context: GameContext
+        self, fragments: _JsonFragments, analyses: Dict[str, str], context: GameContext
     ) -> str:
         """Prompt 14: Final comprehensive analysis"""
-        prompt = self.prompt_templates["prompt_14"].format(
-            game_info=json.dumps(data["game_info"], indent=2),
-            analyses=json.dumps(analyses, indent=2)
+        # The analyses are already prose, so hand them over as headed sections rather than JSON
+        analyses_text = "\n\n".join(
+            f"### {key.replace('_', ' ').title()}\n{analysis}" for key, analysis in analyses.items()
         )
+        prompt = self._render_prompt("prompt_14", context, {
+            "game_info": fragments["game_info"],
+            "analyses_text": analyses_text
+        })
         return await self.get_llm_response(prompt, context)
 
+    async def _write_analyses(self, queue: asyncio.Queue,
+                              progress_callback: Optional[Callable] = None):
+        """Write queued (path, analyses) pairs to disk until a None sentinel arrives"""
+        while (item := await queue.get()) is not None:
+            path, analyses = item
+            try:
+                await asyncio.to_thread(
+                    path.write_bytes, orjson.dumps(analyses, option=orjson.OPT_INDENT_2)
+                )
+                if progress_callback:
+                    progress_callback(f"✓ Analysis saved: {path}")
+            except Exception as e:
+                error_msg = f"❌ Error saving {path}: {str(e)}"
+                print(error_msg)
+                if progress_callback:
+                    progress_callback(error_msg)
+
     async def analyze_week(self, week: int, progress_callback: Optional[Callable] = None) -> List[Dict]:
         """Analyze all games for a specific week"""
-        analyzed_games = []
-        
         # Create weekly directory
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        week_dir = f"Week_{week}_{timestamp}"
-        os.makedirs(week_dir, exist_ok=True)
+        week_dir = Path(f"Week_{week}_{timestamp}")
+        week_dir.mkdir(parents=True, exist_ok=True)
         
-        # Get games for the week
-        games = await self.api_client.get_games(week)
-        total_games = len(games)
+        try:
+            # Get games for the week
+            games = await self.api_client.get_games(week)
+            total_games = len(games)
         
-        if progress_callback:
-            progress_callback(f"Found {total_games} games for Week {week}")
+            if progress_callback:
+                progress_callback(f"Found {total_games} games for Week {week}")
         
-        # Analyze each game
-        for i, game in enumerate(games, 1):
+            # One concurrent pass over the slate's odds instead of a request per game slot
+            slate_odds = await self.odds_fetcher.get_many_odds([game['id'] for game in games])
+            
+            write_queue: asyncio.Queue = asyncio.Queue()
+            writer = asyncio.create_task(self._write_analyses(write_queue, progress_callback))
+            
+            async def analyze_and_save(i: int, game: Dict) -> Optional[Dict]:
+                # Games overlap (one's data fetch with another's LLM calls), a few at a time
+                async with self.game_semaphore:
+                    try:
+                        if progress_callback:
+                            progress_callback(f"Analyzing game {i}/{total_games}...")
+                        
+                        home_team, away_team = extract_teams(game)
+                        analyses = await self.analyze_game(game, progress_callback, (home_team, away_team),
+                                                           slate_odds.get(game['id']))
+                        
+                        # Hand the file off to the writer and free this game slot right away
+                        path = week_dir / f"{_slug(home_team)}_vs_{_slug(away_team)}.json"
+                        filename = str(path)
+                        await write_queue.put((path, analyses))
+                        
+                        return {
+                            "game_id": game['id'],
+                            "home_team": home_team,
+                            "away_team": away_team,
+                            "analyses": analyses,
+                            "file": filename
+                        }
+                    
+                    except Exception as e:
+                        error_msg = f"❌ Error analyzing game: {str(e)}"
+                        print(error_msg)
+                        if progress_callback:
+                            progress_callback(error_msg)
+                        return None
+            
             try:
-                if progress_callback:
-                    progress_callback(f"Analyzing game {i}/{total_games}...")
-                
-                analyses = await self.analyze_game(game, progress_callback)
-                
-                # Save analysis to file
-                filename = (
-                    f"{week_dir}/{game['competitions'][0]['competitors'][0]['team']['displayName']}"
-                    f"_vs_{game['competitions'][0]['competitors'][1]['team']['displayName']}.json"
+                results = await asyncio.gather(
+                    *(analyze_and_save(i, game) for i, game in enumerate(games, 1))
                 )
-                
-                with open(filename, 'w') as f:
-                    json.dump(analyses, f, indent=2)  # Fixed from json.dumps to json.dump
-                
-                analyzed_games.append({
-                    "game_id": game['id'],
-                    "home_team": game['competitions'][0]['competitors'][0]['team']['displayName'],
-                    "away_team": game['competitions'][0]['competitors'][1]['team']['displayName'],
-                    "analyses": analyses,
-                    "file": filename
-                })
-                
-                if progress_callback:
-                    progress_callback(f"✓ Analysis saved: {filename}")
-                
-            except Exception as e:
-                error_msg = f"❌ Error analyzing game: {str(e)}"
-                print(error_msg)
-                if progress_callback:
-                    progress_callback(error_msg)
-                continue
+            finally:
+                # Let the writer drain everything queued so far before returning
+                await write_queue.put(None)
+                await writer
+            analyzed_games = [result for result in results if result is not None]
         
-        return analyzed_games
\ No newline at end of file
+            return analyzed_games
+        finally:
+            await self.api_client.aclose()
+            await self.odds_fetcher.aclose()
+            await self.aclose()
\ No newline at end of file
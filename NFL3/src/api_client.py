@@ -2,61 +2,156 @@
 NFL API Client for handling all API requests
 """
 import asyncio
-from typing import Dict, List, Optional
+import functools
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
 import aiohttp
+import orjson
 from urllib.parse import quote
 
+log = logging.getLogger(__name__)
+
+def _parse_json(raw: str) -> Any:
+    """Decode an API response with orjson, falling back for NaN tokens"""
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+@functools.lru_cache(maxsize=64)
+def _encode_team(team: str) -> str:
+    """URL-encode a team name; each name is only encoded once per run"""
+    return quote(team)
+
+def extract_teams(game_data: Dict) -> Tuple[str, str]:
+    """Home and away team names from an ESPN scoreboard event"""
+    competitors = game_data['competitions'][0]['competitors']
+    return competitors[0]['team']['displayName'], competitors[1]['team']['displayName']
+
 class NFLApiClient:
     """Client for handling NFL API requests"""
     
     def __init__(self):
         self.api_base = "https://sportsstatsgather.com/api/nfl/data"
         self.espn_api = "https://site.api.espn.com/apis/site/v2/sports/football/nfl"
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.timeout = aiohttp.ClientTimeout(total=10, connect=3)
+        
+        # Retry transient failures, then stop calling an endpoint that keeps failing
+        self.max_retries = 3
+        self.retry_delay = 0.5
+        self.circuit_threshold = 5
+        self.circuit_cooldown = 60
+        self._circuit: Dict[str, Tuple[int, float]] = {}  # endpoint -> (failures, last failure)
+        
+        # Recent responses and in-flight fetches, keyed by (endpoint, params)
+        self.cache_ttl = 600
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+                timeout=self.timeout
+            )
+        return self._session
+
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def get_data(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
+        """Make API request, reusing recent responses and coalescing identical in-flight calls"""
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_data(endpoint, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield the shared fetch so one cancelled caller doesn't cancel the rest
+        data = await asyncio.shield(task)
+        if data != {}:  # {} signals a failed request; don't hold on to it
+            self._cache[key] = (time.monotonic(), data)
+        return data
+
+    async def _fetch_data(self, endpoint: str, params: Optional[Dict]) -> Dict:
         """Make API request with proper URL encoding"""
         # Construct URL with proper encoding
         url = f"{self.api_base}/{endpoint}"
         
         # URL encode any team names in params
         if params and 'team' in params:
-            params = params.copy()  # Don't modify original
-            params['team'] = quote(params['team'])
+            params = {**params, 'team': _encode_team(params['team'])}  # Don't modify original
         
-        print(f"Fetching: {url}")
+        log.debug("Fetching: %s", url)
         if params:
-            print(f"With params: {params}")
+            log.debug("With params: %s", params)
+
+        failures, last_failure = self._circuit.get(endpoint, (0, 0.0))
+        if time.monotonic() - last_failure > self.circuit_cooldown:
+            failures = 0
+        if failures >= self.circuit_threshold:
+            log.debug("Skipping %s: endpoint failing repeatedly", url)
+            return {}
 
-        async with aiohttp.ClientSession() as session:
+        session = await self._get_session()
+        for attempt in range(self.max_retries):
             try:
                 async with session.get(url, params=params) as response:
                     if response.status == 200:
-                        return await response.json()
-                    else:
-                        print(f"API call failed: {url} - Status: {response.status}")
-                        text = await response.text()
-                        print(f"Response: {text}")
-                        return {}
+                        data = await response.json(loads=_parse_json)
+                        self._circuit.pop(endpoint, None)
+                        return data
+                    
+                    log.warning("API call failed: %s - Status: %s", url, response.status)
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug("Response: %s", await response.text())
+                    if response.status < 500:
+                        return {}  # Client errors won't succeed on retry
+            except aiohttp.ClientResponseError as e:
+                # A bad body or content type (e.g. a 200 that isn't JSON) won't change on retry
+                log.warning("Invalid response from %s: %r", url, e)
+                return {}
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                log.warning("Error making request to %s (attempt %d/%d): %r",
+                            url, attempt + 1, self.max_retries, e)
             except Exception as e:
-                print(f"Error making request to {url}: {str(e)}")
+                log.error("Error making request to %s: %s", url, e, exc_info=True)
                 return {}
+            
+            if attempt < self.max_retries - 1:
+                await asyncio.sleep(self.retry_delay * 2 ** attempt)
+        
+        self._circuit[endpoint] = (failures + 1, time.monotonic())
+        return {}
 
     async def get_games(self, week: int) -> List[Dict]:
         """Get games for a specific week"""
         url = f"{self.espn_api}/scoreboard"
         params = {"week": week, "seasontype": 2}
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data.get('events', [])
-                    print(f"Failed to fetch games: Status {response.status}")
-                    return []
-            except Exception as e:
-                print(f"Error fetching games: {str(e)}")
+        session = await self._get_session()
+        try:
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json(loads=_parse_json)
+                    return data.get('events', [])
+                log.warning("Failed to fetch games: Status %s", response.status)
                 return []
+        except Exception as e:
+            log.error("Error fetching games: %s", e, exc_info=True)
+            return []
 
     async def get_player_stats(self, team: str, view: str, split: str) -> List[Dict]:
         """Get player statistics"""
@@ -108,21 +203,21 @@ class NFLApiClient:
         """Get game odds from ESPN"""
         url = f"{self.espn_api}/scoreboard/{game_id}/odds"
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data
-                    return None
-            except Exception as e:
-                print(f"Error fetching odds: {str(e)}")
+        session = await self._get_session()
+        try:
+            async with session.get(url) as response:
+                if response.status == 200:
+                    data = await response.json(loads=_parse_json)
+                    return data
                 return None
+        except Exception as e:
+            log.error("Error fetching odds: %s", e, exc_info=True)
+            return None
 
-    async def fetch_all_game_data(self, game_data: Dict) -> Dict:
-        """Fetch all data needed for game analysis"""
-        home_team = game_data['competitions'][0]['competitors'][0]['team']['displayName']
-        away_team = game_data['competitions'][0]['competitors'][1]['team']['displayName']
+    async def fetch_all_game_data(self, game_data: Dict,
+                                  teams: Optional[Tuple[str, str]] = None) -> Dict:
+        """Fetch all data needed for game analysis (odds come from NFLOddsFetcher)"""
+        home_team, away_team = teams or extract_teams(game_data)
 
         # Create tasks for parallel fetching
         tasks = {
@@ -140,17 +235,14 @@ class NFLApiClient:
             'home_logs': self.get_game_logs(home_team),
             'away_logs': self.get_game_logs(away_team),
             'home_opp_logs': self.get_opponent_logs(home_team),
-            'away_opp_logs': self.get_opponent_logs(away_team),
-            'odds': self.get_odds(game_data['id'])
+            'away_opp_logs': self.get_opponent_logs(away_team)
         }
 
-        # Execute all tasks
-        results = {}
-        for key, task in tasks.items():
-            try:
-                results[key] = await task
-            except Exception as e:
-                print(f"Error fetching {key}: {str(e)}")
+        # Execute all tasks concurrently
+        results = dict(zip(tasks, await asyncio.gather(*tasks.values(), return_exceptions=True)))
+        for key, result in results.items():
+            if isinstance(result, Exception):
+                log.error("Error fetching %s: %s", key, result)
                 results[key] = [] if 'logs' in key or key.endswith('_depth') or key.endswith('injuries') else {}
 
         # Organize results
@@ -183,6 +275,5 @@ class NFLApiClient:
             "opponent_logs": {
                 "home": results['home_opp_logs'],
                 "away": results['away_opp_logs']
-            },
-            "odds": results['odds']
+            }
         }
\ No newline at end of file
@@ -1,6 +1,58 @@
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
+from types import MappingProxyType
+import pandas as pd
+
+# Shared read-only default for lookups into sections the API left out
+_EMPTY = MappingProxyType({})
+
+# Processed weather key -> weather API field
+WEATHER_FIELDS = {
+    "temperature": "Temperature",
+    "condition": "Weather Condition",
+    "wind_speed": "Wind Speed",
+    "wind_direction": "Wind Direction",
+    "precipitation_chance": "Precipitation Chance"
+}
+
+INJURY_REQUIRED_KEYS = ("Name", "Pos", "Injury", "Status")
+INJURY_OPTIONAL_DEFAULTS = {"Details": "", "Updated": ""}
+INJURY_COLUMNS = {
+    "Pos": "position",
+    "Injury": "injury",
+    "Status": "status",
+    "Details": "details",
+    "Updated": "updated"
+}
+
+# Game log columns and the value used when a game is missing one
+GAME_LOG_DEFAULTS = {
+    "Week": None,
+    "Opp": None,
+    "Location": None,
+    "Score_Tm": None,
+    "Score_Opp": None,
+    "Total_Yards": 0,
+    "Passing_Yds": 0,
+    "Rushing_Yds": 0,
+    "Turnovers": 0,
+    "Downs_3DAtt": 0,
+    "Downs_3DConv": 0,
+    "ToP": "0:00"
+}
+
+# Per-team sections of the combined data: (section, processor method or None to pass through, empty type)
+TEAM_SECTIONS = (
+    ("depth_charts", "process_depth_chart", list),
+    ("injuries", "process_injuries", list),
+    ("player_stats", None, dict),
+    ("defense", "process_team_defense", dict),
+    ("pressure", "process_pressure_stats", dict),
+    ("team_stats", None, dict),
+    ("game_logs", "process_game_logs", list),
+    ("opponent_logs", "process_game_logs", list)
+)
 
 @dataclass
 class GameContext:
@@ -12,6 +64,7 @@ class GameContext:
     date: str
     weather: Optional[Dict] = None
     odds: Optional[Dict] = None
+    system_context: str = ""
 
 class NFLDataProcessor:
     """Process NFL data for analysis"""
@@ -47,65 +100,61 @@ class NFLDataProcessor:
 
     def process_player_stats(self, data: List[Dict], stat_type: str, timeframe: str) -> Dict:
         """Process player statistics for a specific timeframe"""
+        # Players are skipped only when Name or Position is absent; object dtype keeps
+        # the API's own int/str values instead of upcasting
+        df = pd.DataFrame([player for player in data if "Name" in player and "Position" in player],
+                          dtype=object)
+        if df.empty:
+            return {}
+        
+        # Select this timeframe's columns and drop ones no player has a value for
+        prefix = f"{stat_type} {timeframe} "
+        stats = df[[col for col in df.columns if col.startswith(prefix)]]
+        stats = stats.rename(columns=lambda col: col.removeprefix(prefix))
+        valid = stats.map(self._is_valid_stat)
+        stats, valid = stats.loc[:, valid.any()], valid.loc[:, valid.any()]
+        
         processed = {}
-        for player in data:
-            try:
-                # Filter stats for the specific timeframe and remove NaN values
-                prefix = f"{stat_type} {timeframe} "
-                stats = {
-                    k.replace(prefix, ""): v
-                    for k, v in player.items()
-                    if k.startswith(prefix)
-                    and isinstance(v, (int, float, str))
-                    and str(v).lower() != 'nan'
-                }
-                
-                if stats:  # Only include players with valid stats
-                    processed[player["Name"]] = {
-                        "position": player["Position"],
-                        "stats": stats
-                    }
-            except KeyError:
-                continue  # Skip players with missing required fields
+        for name, position, row, keep in zip(df["Name"], df["Position"],
+                                             stats.to_dict("records"), valid.to_numpy()):
+            player_stats = {key: value for (key, value), ok in zip(row.items(), keep) if ok}
+            if player_stats:  # Only include players with valid stats
+                processed[name] = {"position": position, "stats": player_stats}
                 
         return processed
 
+    @staticmethod
+    def _is_valid_stat(value: Any) -> bool:
+        """True for real numbers and non-'nan' strings"""
+        if isinstance(value, float):
+            return value == value  # NaN is the only float unequal to itself
+        if isinstance(value, str):
+            return value.lower() != 'nan'
+        return isinstance(value, int)
+
     def process_weather(self, data: List[Dict]) -> Dict:
         """Process weather data"""
-        if not data:
-            return {
-                "temperature": "N/A",
-                "condition": "N/A",
-                "wind_speed": "N/A",
-                "wind_direction": "N/A",
-                "precipitation_chance": "N/A"
-            }
-            
-        weather = data[0]
-        return {
-            "temperature": weather.get("Temperature", "N/A"),
-            "condition": weather.get("Weather Condition", "N/A"),
-            "wind_speed": weather.get("Wind Speed", "N/A"),
-            "wind_direction": weather.get("Wind Direction", "N/A"),
-            "precipitation_chance": weather.get("Precipitation Chance", "N/A")
-        }
+        weather = data[0] if data else _EMPTY
+        return {key: weather.get(field, "N/A") for key, field in WEATHER_FIELDS.items()}
 
     def process_injuries(self, data: List[Dict]) -> Dict:
         """Process injury report data"""
-        processed = {}
+        # Entries are skipped only when a required key is absent, not when it is None
+        rows = []
         for player in data:
-            try:
-                processed[player["Name"]] = {
-                    "position": player["Pos"],
-                    "injury": player["Injury"],
-                    "status": player["Status"],
-                    "details": player.get("Details", ""),
-                    "updated": player.get("Updated", "")
-                }
-            except KeyError as e:
-                print(f"Warning: Missing key in injury data: {e}")
+            missing = [key for key in INJURY_REQUIRED_KEYS if key not in player]
+            if missing:
+                print(f"Warning: Missing key in injury data: {missing[0]!r}")
                 continue
-        return processed
+            rows.append({**INJURY_OPTIONAL_DEFAULTS, **player})
+        if not rows:
+            return {}
+        
+        df = pd.DataFrame(rows, columns=["Name", *INJURY_COLUMNS], dtype=object)
+        return (df.drop_duplicates("Name", keep="last")
+                  .set_index("Name")
+                  .rename(columns=INJURY_COLUMNS)
+                  .to_dict("index"))
 
     def process_team_defense(self, data: Dict) -> Dict:
         """Process team defense statistics"""
@@ -145,60 +194,58 @@ class NFLDataProcessor:
 
     def process_game_logs(self, data: List[Dict]) -> List[Dict]:
         """Process game logs data"""
-        processed = []
-        for game in data:
-            try:
-                processed.append({
-                    "week": game.get("Week"),
-                    "opponent": game.get("Opp"),
-                    "location": game.get("Location"),
-                    "score": {
-                        "team": game.get("Score_Tm"),
-                        "opponent": game.get("Score_Opp")
+        if not data:
+            return []
+        
+        # Defaults fill only absent keys; values present as None are kept, as with game.get()
+        df = pd.DataFrame([{**GAME_LOG_DEFAULTS, **game} for game in data],
+                          columns=list(GAME_LOG_DEFAULTS), dtype=object)
+        
+        return [
+            {
+                "week": game["Week"],
+                "opponent": game["Opp"],
+                "location": game["Location"],
+                "score": {
+                    "team": game["Score_Tm"],
+                    "opponent": game["Score_Opp"]
+                },
+                "stats": {
+                    "total_yards": game["Total_Yards"],
+                    "passing_yards": game["Passing_Yds"],
+                    "rushing_yards": game["Rushing_Yds"],
+                    "turnovers": game["Turnovers"],
+                    "third_down": {
+                        "attempts": game["Downs_3DAtt"],
+                        "conversions": game["Downs_3DConv"]
                     },
-                    "stats": {
-                        "total_yards": game.get("Total_Yards", 0),
-                        "passing_yards": game.get("Passing_Yds", 0),
-                        "rushing_yards": game.get("Rushing_Yds", 0),
-                        "turnovers": game.get("Turnovers", 0),
-                        "third_down": {
-                            "attempts": game.get("Downs_3DAtt", 0),
-                            "conversions": game.get("Downs_3DConv", 0)
-                        },
-                        "time_of_possession": game.get("ToP", "0:00")
-                    }
-                })
-            except Exception as e:
-                print(f"Warning: Error processing game log: {str(e)}")
-                continue
-                
-        return processed
+                    "time_of_possession": game["ToP"]
+                }
+            }
+            for game in df.to_dict("records")
+        ]
 
     def process_odds(self, odds_data: Dict) -> Dict:
         """Process odds data"""
-        if not odds_data:
-            return {
-                "spread": {"home": "N/A", "away": "N/A"},
-                "total": "N/A",
-                "moneyline": {"home": "N/A", "away": "N/A"}
-            }
-            
+        odds_data = odds_data or _EMPTY
+        spread = odds_data.get("spread", _EMPTY)
+        moneyline = odds_data.get("moneyline", _EMPTY)
         return {
             "spread": {
-                "home": odds_data.get("spread", {}).get("home", "N/A"),
-                "away": odds_data.get("spread", {}).get("away", "N/A")
+                "home": spread.get("home", "N/A"),
+                "away": spread.get("away", "N/A")
             },
             "total": odds_data.get("overUnder", "N/A"),
             "moneyline": {
-                "home": odds_data.get("moneyline", {}).get("home", "N/A"),
-                "away": odds_data.get("moneyline", {}).get("away", "N/A")
+                "home": moneyline.get("home", "N/A"),
+                "away": moneyline.get("away", "N/A")
             }
         }
 
     def combine_analysis_data(self, raw_data: Dict, game_context: GameContext) -> Dict:
         """Combine all processed data for analysis"""
         try:
-            return {
+            combined = {
                 "game_info": {
                     "id": game_context.game_id,
                     "home_team": game_context.home_team,
@@ -207,40 +254,18 @@ class NFLDataProcessor:
                     "date": game_context.date,
                     "weather": self.process_weather(raw_data.get("weather", [])),
                     "odds": self.process_odds(raw_data.get("odds", {}))
-                },
-                "depth_charts": {
-                    "home": self.process_depth_chart(raw_data.get("depth_charts", {}).get("home", [])),
-                    "away": self.process_depth_chart(raw_data.get("depth_charts", {}).get("away", []))
-                },
-                "injuries": {
-                    "home": self.process_injuries(raw_data.get("injuries", {}).get("home", [])),
-                    "away": self.process_injuries(raw_data.get("injuries", {}).get("away", []))
-                },
-                "player_stats": {
-                    "home": raw_data.get("player_stats", {}).get("home", {}),
-                    "away": raw_data.get("player_stats", {}).get("away", {})
-                },
-                "defense": {
-                    "home": self.process_team_defense(raw_data.get("defense", {}).get("home", {})),
-                    "away": self.process_team_defense(raw_data.get("defense", {}).get("away", {}))
-                },
-                "pressure": {
-                    "home": self.process_pressure_stats(raw_data.get("pressure", {}).get("home", {})),
-                    "away": self.process_pressure_stats(raw_data.get("pressure", {}).get("away", {}))
-                },
-                "team_stats": {
-                    "home": raw_data.get("team_stats", {}).get("home", {}),
-                    "away": raw_data.get("team_stats", {}).get("away", {})
-                },
-                "game_logs": {
-                    "home": self.process_game_logs(raw_data.get("game_logs", {}).get("home", [])),
-                    "away": self.process_game_logs(raw_data.get("game_logs", {}).get("away", []))
-                },
-                "opponent_logs": {
-                    "home": self.process_game_logs(raw_data.get("opponent_logs", {}).get("home", [])),
-                    "away": self.process_game_logs(raw_data.get("opponent_logs", {}).get("away", []))
                 }
             }
+            
+            for section, method_name, empty in TEAM_SECTIONS:
+                sides = raw_data.get(section) or {}
+                values = {side: sides.get(side) or empty() for side in ("home", "away")}
+                if method_name:
+                    process = getattr(self, method_name)
+                    values = {side: process(value) for side, value in values.items()}
+                combined[section] = values
+            
+            return combined
         except Exception as e:
             print(f"Error combining analysis data: {str(e)}")
-            raise
\ No newline at end of file
+            raise
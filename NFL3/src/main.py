@@ -2,10 +2,14 @@ import asyncio
 from typing import List, Dict, Optional
 import sys
 import os
+import time
 from datetime import datetime
 from pathlib import Path
 from .analyzer import NFLAnalyzer
 
+# Minimum seconds between redraws of the interactive progress line
+PROGRESS_REFRESH_INTERVAL = 0.1
+
 class AnalysisProgress:
     """Track and display analysis progress"""
     
@@ -15,6 +19,11 @@ class AnalysisProgress:
         self.current_game = 0
         self.total_games = 0
         
+        # On a terminal, redraw one status line in place instead of scrolling a line per step
+        self.interactive = sys.stdout.isatty()
+        self._last_draw = 0.0
+        self._line_width = 0
+        
     def set_total_games(self, total: int):
         """Set total number of games to analyze"""
         self.total_games = total
@@ -29,10 +38,31 @@ class AnalysisProgress:
         """Update progress display"""
         self.current_step += 1
         game_progress = f"Game {self.current_game}/{self.total_games}: " if self.total_games > 0 else ""
-        print(f"[{self.current_step}/{self.total_steps}] {game_progress}{step}")
+        line = f"[{self.current_step}/{self.total_steps}] {game_progress}{step}"
+        if not self.interactive:
+            print(line)
+            return
+        
+        # Saved files and errors stay on screen; routine steps are throttled redraws
+        keep = step.startswith(("✓", "❌"))
+        now = time.monotonic()
+        if not keep and now - self._last_draw < PROGRESS_REFRESH_INTERVAL:
+            return
+        self._last_draw = now
+        sys.stdout.write("\r" + line.ljust(self._line_width) + ("\n" if keep else ""))
+        sys.stdout.flush()
+        self._line_width = 0 if keep else len(line)
+        
+    def finish_line(self):
+        """End the in-place status line so later output starts on a fresh line"""
+        if self._line_width:
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+            self._line_width = 0
         
     def complete(self):
         """Mark analysis as complete"""
+        self.finish_line()
         print("\n✓ Analysis complete!")
 
 class NFLAnalysisManager:
@@ -109,6 +139,7 @@ class NFLAnalysisManager:
                 week, 
                 progress_callback=self.progress.update
             )
+            self.progress.finish_line()
             
             # Print summary
             self.print_analysis_summary(week, output_dir, analyzed_games)
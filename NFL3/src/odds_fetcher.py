@@ -1,50 +1,123 @@
+import asyncio
+import time
 import aiohttp
-from typing import Dict, Optional
-import json
+import orjson
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_PROVIDER = "ESPN BET"
 
 class NFLOddsFetcher:
     """Handle fetching and processing of NFL odds data"""
     
     def __init__(self):
         self.espn_odds_base = "https://sports.core.api.espn.com/v2/sports/football/leagues/nfl"
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Processed odds cached on disk per game; delete the directory to invalidate
+        self.cache_dir = Path('cache/odds')
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_ttl = 5 * 60
+
+    async def __aenter__(self) -> "NFLOddsFetcher":
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+            )
+        return self._session
 
-    async def get_odds(self, game_id: str) -> Optional[Dict]:
-        """Fetch current odds for a game from ESPN"""
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _read_cache(self, path: Path, ttl: float) -> Optional[Dict]:
+        """Return cached odds if present and younger than ttl"""
+        try:
+            if time.time() - path.stat().st_mtime < ttl:
+                return orjson.loads(path.read_bytes())
+        except (OSError, ValueError):
+            pass
+        return None
+
+    async def get_odds(self, game_id: str, ttl: Optional[float] = None) -> Optional[Dict]:
+        """Fetch current odds for a game from ESPN (pass a longer ttl once lines are final)"""
+        cache_path = self.cache_dir / f"{game_id}.json"
+        cached = await asyncio.to_thread(
+            self._read_cache, cache_path, self.cache_ttl if ttl is None else ttl
+        )
+        if cached is not None:
+            return cached
+        
         url = f"{self.espn_odds_base}/events/{game_id}/competitions/{game_id}/odds"
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return self._process_odds_data(data)
+        session = await self._get_session()
+        try:
+            async with session.get(url) as response:
+                if response.status != 200:
                     return None
-            except Exception as e:
-                print(f"Error fetching odds data: {str(e)}")
-                return None
+                # Parse the raw body directly; ESPN's odds payloads run to several KB
+                data = orjson.loads(await response.read())
+        except Exception as e:
+            print(f"Error fetching odds data: {str(e)}")
+            return None
+        
+        odds = self._process_odds_data(data)
+        if odds is not None:
+            try:
+                await asyncio.to_thread(cache_path.write_bytes, orjson.dumps(odds))
+            except OSError as e:
+                print(f"Warning: could not cache odds data: {str(e)}")
+        return odds
 
-    def _process_odds_data(self, data: Dict) -> Optional[Dict]:
-        """Process raw odds data from ESPN"""
-        try:
-            # Find ESPN BET provider
-            espn_bet_odds = next(
-                (item for item in data.get('items', [])
-                 if item.get('provider', {}).get('name') == "ESPN BET"),
-                None
-            )
+    async def get_many_odds(self, game_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """Fetch odds for a whole slate of games concurrently"""
+        results = await asyncio.gather(
+            *(self.get_odds(game_id) for game_id in game_ids), return_exceptions=True
+        )
+        odds = {}
+        for game_id, result in zip(game_ids, results):
+            if isinstance(result, Exception):
+                print(f"Error fetching odds for game {game_id}: {str(result)}")
+                result = None
+            odds[game_id] = result
+        return odds
 
-            if not espn_bet_odds:
+    @staticmethod
+    def _index_providers(data: Dict) -> Dict[str, Dict]:
+        """Map each sportsbook's name to its odds item (first listing wins)"""
+        by_provider = {}
+        for item in data.get('items', []):
+            name = (item.get('provider') or {}).get('name')
+            if name is not None:
+                by_provider.setdefault(name, item)
+        return by_provider
+
+    def _process_odds_data(self, data: Dict, provider_name: str = DEFAULT_PROVIDER) -> Optional[Dict]:
+        """Process raw odds data from ESPN for one sportsbook"""
+        try:
+            provider_odds = self._index_providers(data).get(provider_name)
+            if not provider_odds:
                 return None
 
             return {
-                'overUnder': espn_bet_odds.get('overUnder'),
+                'overUnder': provider_odds.get('overUnder'),
                 'spread': {
-                    'home': espn_bet_odds.get('homeTeamOdds', {}).get('pointSpread', {}).get('american'),
-                    'away': espn_bet_odds.get('awayTeamOdds', {}).get('pointSpread', {}).get('american')
+                    'home': provider_odds.get('homeTeamOdds', {}).get('pointSpread', {}).get('american'),
+                    'away': provider_odds.get('awayTeamOdds', {}).get('pointSpread', {}).get('american')
                 },
                 'moneyline': {
-                    'home': espn_bet_odds.get('homeTeamOdds', {}).get('moneyLine'),
-                    'away': espn_bet_odds.get('awayTeamOdds', {}).get('moneyLine')
+                    'home': provider_odds.get('homeTeamOdds', {}).get('moneyLine'),
+                    'away': provider_odds.get('awayTeamOdds', {}).get('moneyLine')
                 }
             }
         except Exception as e: